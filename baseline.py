@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tracemalloc
+
+from common import days, input_cache
+
+BASELINE_FILE = os.path.join(days.ROOT, "baseline.json")
+
+def measure(day, part, filename, warmup, trials):
+	## Peak memory is measured on the first run, since tracemalloc slows everything down and later runs reuse whatever
+	## the solver cached in memory. The day is imported beforehand so the import is not counted against part 1.
+	days.load(day)
+	tracemalloc.start()
+	try:
+		days.solve(day, part, filename)
+		_, peak_memory = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	for _ in range(warmup):
+		days.solve(day, part, filename)
+	timings = [days.solve(day, part, filename)[1] for _ in range(trials)]
+	return {"median": statistics.median(timings), "peak_memory": peak_memory}
+
+def measure_all(selected_days, warmup, trials):
+	measurements = dict()
+	for day in selected_days:
+		for part in (1, 2):
+			print("Measuring day {} part {}".format(day, part), file = sys.stderr)
+			measurements.setdefault(str(day), dict())[str(part)] = measure(day, part, days.default_input(day), warmup, trials)
+	return measurements
+
+def compare(baseline, measurements, threshold, min_time):
+	rows = []
+	regressed = False
+	for day, parts in measurements.items():
+		for part, measurement in parts.items():
+			reference = baseline.get(day, dict()).get(part)
+			if not reference:
+				rows.append((day, part, None, measurement["median"], None, None, measurement["peak_memory"], None, "new"))
+				continue
+			time_change = measurement["median"] / reference["median"] - 1 if reference["median"] else 0.0
+			memory_change = measurement["peak_memory"] / reference["peak_memory"] - 1 if reference["peak_memory"] else 0.0
+			## Changes in tiny timings are mostly noise, so only parts above min_time can regress on time
+			slower = time_change > threshold and measurement["median"] > min_time
+			larger = memory_change > threshold
+			regressed |= slower or larger
+			status = "REGRESSED" if slower or larger else "ok"
+			rows.append((day, part, reference["median"], measurement["median"], time_change, reference["peak_memory"], measurement["peak_memory"], memory_change, status))
+	return rows, regressed
+
+def format_change(change):
+	return "{:>+8.1%}".format(change) if change is not None else "{:>8}".format("-")
+
+def print_table(rows):
+	print("{:>3} {:>4}  {:>10} {:>10} {:>8}  {:>12} {:>12} {:>8}  {}".format("day", "part", "base time", "time", "change", "base memory", "memory", "change", "status"))
+	for day, part, base_time, time, time_change, base_memory, memory, memory_change, status in rows:
+		print("{:>3} {:>4}  {:>10} {:>10.4f} {}  {:>12} {:>12} {}  {}".format(day, part, "-" if base_time is None else "{:.4f}".format(base_time), time, format_change(time_change), "-" if base_memory is None else base_memory, memory, format_change(memory_change), status))
+
+def main():
+	parser = argparse.ArgumentParser(description = "Record or check per-part timing and memory baselines on the reference inputs")
+	parser.add_argument("command", choices = ("record", "check"))
+	parser.add_argument("days", nargs = "*", type = int, help = "days to measure (default: all)")
+	parser.add_argument("-f", "--file", default = BASELINE_FILE, help = "baseline file")
+	parser.add_argument("-w", "--warmup", type = int, default = 1, help = "untimed runs before the trials")
+	parser.add_argument("-n", "--trials", type = int, default = 5, help = "timed runs, the median is kept")
+	parser.add_argument("-t", "--threshold", type = float, default = 0.25, help = "allowed relative increase before a part counts as regressed")
+	parser.add_argument("--min-time", type = float, default = 0.05, help = "medians below this many seconds never count as time regressions")
+	arguments = parser.parse_args()
+
+	## Every run parses its input, so days with and without a cached parse stage are timed alike
+	input_cache.enabled = False
+	selected_days = arguments.days or days.discover()
+	measurements = measure_all(selected_days, arguments.warmup, arguments.trials)
+	if arguments.command == "record":
+		baseline = dict()
+		if os.path.exists(arguments.file):
+			with open(arguments.file, mode = 'r') as file:
+				baseline = json.load(file)
+		for day, parts in measurements.items():
+			baseline.setdefault(day, dict()).update(parts)
+		baseline = {day: baseline[day] for day in sorted(baseline, key = int)}
+		with open(arguments.file, mode = 'w') as file:
+			json.dump(baseline, file, indent = "\t")
+			file.write("\n")
+		print("Recorded {} parts in {}".format(sum(len(parts) for parts in measurements.values()), arguments.file))
+	else:
+		with open(arguments.file, mode = 'r') as file:
+			baseline = json.load(file)
+		rows, regressed = compare(baseline, measurements, arguments.threshold, arguments.min_time)
+		print_table(rows)
+		if regressed:
+			sys.exit(1)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,55 @@
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import sys
+
+from common import days
+
+def find_inputs(patterns):
+	filenames = []
+	for pattern in patterns:
+		if os.path.isdir(pattern):
+			## Only the .txt files of a directory are inputs, so a day directory does not pull in its main.py
+			filenames += sorted(path for path in glob.glob(os.path.join(pattern, "*.txt")) if os.path.isfile(path))
+		else:
+			filenames += sorted(glob.glob(pattern))
+	return filenames
+
+def preload(day):
+	## Importing the day once per worker also builds any module level lookup tables once
+	days.load(day)
+
+def solve_chunk(day, parts, filenames):
+	results = []
+	for filename in filenames:
+		for part in parts:
+			try:
+				output, elapsed = days.solve(day, part, filename)
+				results.append({"file": filename, "part": part, "output": output, "time": elapsed})
+			except Exception as error:
+				results.append({"file": filename, "part": part, "error": repr(error)})
+	return results
+
+def main():
+	parser = argparse.ArgumentParser(description = "Solve many input files for one day, streaming JSON lines in completion order")
+	parser.add_argument("day", type = int)
+	parser.add_argument("inputs", nargs = "+", help = "input files, directories (their .txt files) or glob patterns")
+	parser.add_argument("-p", "--part", type = int, choices = (1, 2), action = "append", help = "part to solve (default: both)")
+	parser.add_argument("-j", "--processes", type = int, default = os.cpu_count(), help = "size of the process pool")
+	parser.add_argument("--chunk-size", type = int, help = "input files per task (default: about four tasks per process)")
+	arguments = parser.parse_args()
+
+	filenames = find_inputs(arguments.inputs)
+	parts = arguments.part or [1, 2]
+	chunk_size = arguments.chunk_size or max(1, -(-len(filenames) // (4 * arguments.processes)))
+	with concurrent.futures.ProcessPoolExecutor(max_workers = arguments.processes, initializer = preload, initargs = (arguments.day,)) as executor:
+		futures = [executor.submit(solve_chunk, arguments.day, parts, filenames[i:i + chunk_size]) for i in range(0, len(filenames), chunk_size)]
+		for future in concurrent.futures.as_completed(futures):
+			for result in future.result():
+				print(json.dumps(result))
+			sys.stdout.flush()
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,325 @@
+import itertools
+import string
+
+## Each generator takes a size parameter and a random.Random, and returns the text of a valid puzzle input for that day.
+## SIZES holds the smallest size the harness starts doubling from, chosen so that the reference solvers take a few
+## milliseconds at that size.
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+def day1(num_lines, rng):
+	lines = []
+	for _ in range(num_lines):
+		tokens = [rng.choice((rng.choice(DIGIT_WORDS), rng.choice(string.digits[1:]), "".join(rng.choices(string.ascii_lowercase, k = rng.randint(1, 5))))) for _ in range(rng.randint(2, 8))]
+		tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(string.digits[1:]))
+		lines.append("".join(tokens))
+	return "\n".join(lines) + "\n"
+
+def day2(num_games, rng):
+	lines = []
+	for game in range(1, num_games + 1):
+		draws = []
+		for _ in range(rng.randint(1, 6)):
+			colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+			draws.append(", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+		lines.append(f"Game {game}: " + "; ".join(draws))
+	return "\n".join(lines) + "\n"
+
+def day3(side, rng):
+	lines = []
+	for _ in range(side):
+		row = []
+		while len(row) < side:
+			roll = rng.random()
+			if roll < 0.15:
+				row.extend(str(rng.randint(1, 999)))
+			elif roll < 0.22:
+				row.append(rng.choice("*#+$@/=%&-"))
+			else:
+				row.extend("." * rng.randint(1, 4))
+		lines.append("".join(row[:side - 1]) + ".")
+	return "\n".join(lines) + "\n"
+
+def day4(num_cards, rng):
+	lines = []
+	width = len(str(num_cards))
+	for card in range(1, num_cards + 1):
+		numbers = rng.sample(range(1, 100), 35)
+		winning = numbers[:10]
+		## Draw some winners into the hand so cards win a realistic number of copies
+		have = rng.sample(winning, rng.randint(0, min(10, num_cards - card))) + numbers[10:]
+		have = have[:25]
+		rng.shuffle(have)
+		lines.append(f"Card {card:{width}}: " + " ".join(f"{number:2}" for number in winning) + " | " + " ".join(f"{number:2}" for number in have))
+	return "\n".join(lines) + "\n"
+
+def day5(num_rules, rng):
+	names = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+	space = 2**32
+	seeds = []
+	for _ in range(10):
+		start = rng.randrange(space // 2)
+		seeds += [start, rng.randrange(1, space // 20)]
+	sections = ["seeds: " + " ".join(map(str, seeds))]
+	for from_name, to_name in zip(names, names[1:]):
+		breakpoints = sorted(rng.sample(range(1, space), 2 * num_rules))
+		lines = []
+		for from_start, from_stop in zip(breakpoints[0::2], breakpoints[1::2]):
+			lines.append(f"{rng.randrange(space - (from_stop - from_start))} {from_start} {from_stop - from_start}")
+		rng.shuffle(lines)
+		sections.append(f"{from_name}-to-{to_name} map:\n" + "\n".join(lines))
+	return "\n\n".join(sections) + "\n"
+
+def day6(num_races, rng):
+	times = [rng.randint(30, 99) for _ in range(num_races)]
+	distances = [rng.randint(time * time // 8, time * time // 4 - 1) for time in times]
+	width = 7
+	return "Time:     " + "".join(f"{time:{width}}" for time in times) + "\nDistance: " + "".join(f"{distance:{width}}" for distance in distances) + "\n"
+
+def day7(num_hands, rng):
+	hands = set()
+	while len(hands) < num_hands:
+		hands.add("".join(rng.choices("23456789TJQKA", k = 5)))
+	return "\n".join(f"{hand} {rng.randint(1, 1000)}" for hand in hands) + "\n"
+
+def node_names(rng):
+	## Three letter names that end in neither A nor Z, so only the start and end nodes of each ghost match
+	names = ["".join(letters) for letters in itertools.product(string.ascii_uppercase, string.ascii_uppercase, string.ascii_uppercase[1:-1])]
+	rng.shuffle(names)
+	return names
+
+def day8(num_nodes, rng):
+	## Every ghost walks a ring regardless of instructions, so each reaches its end node periodically. Like the real
+	## inputs, the ring lengths are distinct primes times a shared factor.
+	shared_factor = 31
+	primes = [n for n in range(max(2, num_nodes // (6 * shared_factor)), num_nodes) if all(n % d for d in range(2, int(n**0.5) + 1))]
+	periods = [shared_factor * prime for prime in primes[:6]]
+	prefixes = ["AA"] + rng.sample([first + second for first, second in itertools.product(string.ascii_uppercase, repeat = 2) if first + second not in ("AA", "ZZ")], 5)
+	names = iter(node_names(rng))
+	lines = []
+	for prefix, period in zip(prefixes, periods):
+		start_name, end_name = (prefix + "A", prefix + "Z") if prefix != "AA" else ("AAA", "ZZZ")
+		ring = [next(names) for _ in range(period - 1)] + [end_name]
+		lines.append(f"{start_name} = ({ring[0]}, {ring[0]})")
+		for node, following in zip(ring, ring[1:] + ring[:1]):
+			lines.append(f"{node} = ({following}, {following})")
+	rng.shuffle(lines)
+	return "".join(rng.choices("LR", k = 263)) + "\n\n" + "\n".join(lines) + "\n"
+
+def day9(num_series, rng):
+	lines = []
+	for _ in range(num_series):
+		coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+		lines.append(" ".join(str(sum(c * x**i for i, c in enumerate(coefficients))) for x in range(21)))
+	return "\n".join(lines) + "\n"
+
+def draw_loop(grid, path):
+	directions = {(-1, 0): "U", (1, 0): "D", (0, -1): "L", (0, 1): "R"}
+	pipes = {frozenset("UD"): "|", frozenset("LR"): "-", frozenset("UR"): "L", frozenset("UL"): "J", frozenset("DL"): "7", frozenset("DR"): "F"}
+	for previous, current, following in zip(path[-1:] + path[:-1], path, path[1:] + path[:1]):
+		exits = {directions[previous[0] - current[0], previous[1] - current[1]], directions[following[0] - current[0], following[1] - current[1]]}
+		grid[current[0]][current[1]] = pipes[frozenset(exits)]
+
+def day10(side, rng):
+	## A rectangular loop whose top edge is a square wave, surrounded and filled with junk pipes
+	grid = [[rng.choice("|-LJ7F.") for _ in range(side)] for _ in range(side)]
+	path = [(1, 1), (1, 2)]
+	y, x = 1, 2
+	while x + 2 < side - 2:
+		depth = rng.randint(0, side // 2)
+		path += [(y + i, x) for i in range(1, depth + 1)]
+		path += [(y + depth, x + 1)]
+		path += [(y + depth - i, x + 1) for i in range(1, depth + 1)]
+		path += [(y, x + 2)]
+		x += 2
+	path += [(y, x) for x in range(x + 1, side - 1)]
+	x = side - 2
+	path += [(y, x) for y in range(2, side - 1)]
+	y = side - 2
+	path += [(y, x) for x in range(side - 3, 0, -1)]
+	x = 1
+	path += [(y, x) for y in range(side - 3, 1, -1)]
+	draw_loop(grid, path)
+	grid[1][1] = "S"
+	## The start must connect to exactly the two loop pipes next to it
+	grid[0][1] = grid[1][0] = "."
+	return "\n".join("".join(row) for row in grid) + "\n"
+
+def day11(side, rng):
+	rows = []
+	for _ in range(side):
+		if rng.random() < 0.05:
+			rows.append("." * side)
+		else:
+			rows.append("".join("#" if rng.random() < 0.02 else "." for _ in range(side)))
+	return "\n".join(rows) + "\n"
+
+def day12(num_records, rng):
+	lines = []
+	for _ in range(num_records):
+		groups = [rng.randint(1, 4) for _ in range(rng.randint(1, 5))]
+		springs = "." * rng.randint(0, 2) + ".".join("#" * group + "." * rng.randint(0, 2) for group in groups) + "." * rng.randint(0, 2)
+		record = "".join("?" if rng.random() < 0.5 else spring for spring in springs)
+		lines.append(f"{record} {','.join(map(str, groups))}")
+	return "\n".join(lines) + "\n"
+
+def day13(num_patterns, rng):
+	patterns = []
+	for _ in range(num_patterns):
+		width = rng.randint(5, 17)
+		half = ["".join(rng.choices(".#", k = width)) for _ in range(rng.randint(1, 4))]
+		pattern = half + half[::-1] + ["".join(rng.choices(".#", k = width)) for _ in range(rng.randint(1, 6))]
+		if rng.random() < 0.5:
+			pattern = ["".join(glyphs) for glyphs in zip(*pattern)]
+		patterns.append("\n".join(pattern))
+	return "\n\n".join(patterns) + "\n"
+
+def day14(side, rng):
+	return "\n".join("".join(rng.choices(".O#", weights = (6, 3, 1), k = side)) for _ in range(side)) + "\n"
+
+def day15(num_steps, rng):
+	labels = ["".join(rng.choices(string.ascii_lowercase, k = rng.randint(2, 6))) for _ in range(max(1, num_steps // 4))]
+	steps = [rng.choice(labels) + (f"={rng.randint(1, 9)}" if rng.random() < 0.6 else "-") for _ in range(num_steps)]
+	return ",".join(steps) + "\n"
+
+def day16(side, rng):
+	return "\n".join("".join(rng.choices(".|-/\\", weights = (90, 2, 2, 3, 3), k = side)) for _ in range(side)) + "\n"
+
+def day17(side, rng):
+	return "\n".join("".join(rng.choices("123456789", k = side)) for _ in range(side)) + "\n"
+
+def dig_loop(num_steps, rng):
+	## An x-monotone staircase polygon: up, then alternating right and up/down steps, then down and back left
+	height = rng.randint(1, 1000)
+	instructions = [("U", height)]
+	total_width = 0
+	for i in range(num_steps):
+		width = rng.randint(1, 1000)
+		total_width += width
+		instructions.append(("R", width))
+		if i < num_steps - 1:
+			step = rng.choice([-1, 1]) * rng.randint(1, 1000)
+			if height + step <= 0:
+				step = -step
+			height += step
+			instructions.append(("U" if step > 0 else "D", abs(step)))
+	instructions += [("D", height), ("L", total_width)]
+	return instructions
+
+def day18(num_instructions, rng):
+	num_steps = max(1, (num_instructions - 2) // 2)
+	small = dig_loop(num_steps, rng)
+	large = dig_loop(num_steps, rng)
+	lines = []
+	for (direction, distance), (hex_direction, hex_distance) in zip(small, large):
+		lines.append(f"{direction} {distance} (#{hex_distance:05x}{'RDLU'.index(hex_direction)})")
+	return "\n".join(lines) + "\n"
+
+def day19(num_workflows, rng):
+	names = [f"w{i}" for i in range(num_workflows)]
+	names[0] = "in"
+	lines = []
+	for i, name in enumerate(names):
+		targets = names[i + 1:i + 20] + ["A", "R"]
+		rules = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{rng.choice(targets)}" for _ in range(rng.randint(1, 3))]
+		lines.append(f"{name}{{{','.join(rules + [rng.choice(targets)])}}}")
+	parts = [f"{{x={rng.randint(1, 4000)},m={rng.randint(1, 4000)},a={rng.randint(1, 4000)},s={rng.randint(1, 4000)}}}" for _ in range(num_workflows)]
+	return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
+
+def day20(period, rng):
+	## Four binary counters like the real inputs: flip-flops chained bit by bit, with a hub conjunction that fires and
+	## resets the counter whenever it reaches its period, feeding rx through an inverter and a final conjunction
+	num_bits = max(2, period.bit_length())
+	names = iter(name.lower() for name in node_names(rng))
+	lines = []
+	first_bits = []
+	inverters = []
+	for _ in range(4):
+		counter_period = rng.randrange(2**(num_bits - 1) + 1, 2**num_bits, 2)
+		bits = [next(names) for _ in range(num_bits)]
+		hub = next(names)
+		inverter = next(names)
+		hub_destinations = []
+		for i, bit in enumerate(bits):
+			destinations = bits[i + 1:i + 2]
+			if counter_period >> i & 1:
+				destinations.append(hub)
+			if i == 0 or not counter_period >> i & 1:
+				hub_destinations.append(bit)
+			lines.append(f"%{bit} -> {', '.join(destinations)}")
+		lines.append(f"&{hub} -> {', '.join(hub_destinations + [inverter])}")
+		first_bits.append(bits[0])
+		inverters.append(inverter)
+	final = next(names)
+	for inverter in inverters:
+		lines.append(f"&{inverter} -> {final}")
+	lines.append(f"&{final} -> rx")
+	lines.append(f"broadcaster -> {', '.join(first_bits)}")
+	rng.shuffle(lines)
+	return "\n".join(lines) + "\n"
+
+def day21(side, rng):
+	side |= 1
+	middle = side // 2
+	rows = []
+	for y in range(side):
+		if y in (0, middle, side - 1):
+			rows.append("." * side)
+		else:
+			row = ["#" if rng.random() < 0.1 else "." for _ in range(side)]
+			row[0] = row[middle] = row[-1] = "."
+			rows.append("".join(row))
+	rows[middle] = rows[middle][:middle] + "S" + rows[middle][middle + 1:]
+	return "\n".join(rows) + "\n"
+
+def day22(num_bricks, rng):
+	occupied = set()
+	bricks = []
+	z_range = max(10, num_bricks // 3)
+	while len(bricks) < num_bricks:
+		x, y, z = rng.randrange(10), rng.randrange(10), rng.randint(1, z_range)
+		axis = rng.randrange(3)
+		length = rng.randint(0, 3)
+		end = [x, y, z]
+		end[axis] += length
+		if end[0] > 9 or end[1] > 9:
+			continue
+		cells = {(x + (axis == 0) * i, y + (axis == 1) * i, z + (axis == 2) * i) for i in range(length + 1)}
+		if cells & occupied:
+			continue
+		occupied |= cells
+		bricks.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+	return "\n".join(bricks) + "\n"
+
+def day23(side, rng, num_junctions = 5):
+	## A lattice of junctions joined by straight corridors, with slopes forcing the walk right and down like the real
+	## inputs. The junction count is fixed so part 2's longest path search stays tractable while corridors scale.
+	gap = max(3, (side - 1) // (num_junctions + 1))
+	side = gap * (num_junctions + 1) + 1
+	lines = [["#"] * side for _ in range(side)]
+	stops = [gap * (i + 1) for i in range(num_junctions)]
+	for row in stops:
+		for column in range(stops[0], stops[-1] + 1):
+			lines[row][column] = "."
+	for column in stops:
+		for row in range(stops[0], stops[-1] + 1):
+			lines[row][column] = "."
+	for row in stops:
+		for column in stops[:-1]:
+			lines[row][column + 1] = lines[row][column + gap - 1] = ">"
+	for column in stops:
+		for row in stops[:-1]:
+			lines[row + 1][column] = lines[row + gap - 1][column] = "v"
+	for row in range(0, stops[0]):
+		lines[row][stops[0]] = "."
+	for row in range(stops[-1] + 1, side):
+		lines[row][stops[-1]] = "."
+	lines[stops[-1] + 1][stops[-1]] = "v"
+	return "\n".join("".join(line) for line in lines) + "\n"
+
+GENERATORS = {int(name[3:]): generator for name, generator in list(globals().items()) if name.startswith("day") and name[3:].isdigit()}
+
+SIZES = {
+	1: 1000, 2: 500, 3: 50, 4: 200, 5: 50, 6: 16, 7: 500, 8: 500, 9: 200, 10: 40, 11: 40, 12: 100,
+	13: 50, 14: 20, 15: 1000, 16: 20, 17: 20, 18: 50, 19: 100, 20: 64, 21: 31, 22: 200, 23: 30,
+}
@@ -0,0 +1,70 @@
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from benchmark import generators
+from common import days, input_cache
+
+def fit_exponent(sizes, timings):
+	## Least squares slope of log(time) against log(size), i.e. k in time ~ size^k
+	points = [(math.log(size), math.log(timing)) for size, timing in zip(sizes, timings) if timing and timing > 0]
+	if len(points) < 2:
+		return None
+	mean_x = sum(x for x, _ in points) / len(points)
+	mean_y = sum(y for _, y in points) / len(points)
+	variance = sum((x - mean_x) ** 2 for x, _ in points)
+	if not variance:
+		return None
+	return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+def measure(day, part, filename, repeat):
+	best = None
+	for _ in range(repeat):
+		try:
+			_, elapsed = days.solve(day, part, filename)
+		except Exception:
+			return None
+		best = elapsed if best is None else min(best, elapsed)
+	return best
+
+def benchmark_day(day, base_size, num_sizes, repeat, seed, directory):
+	sizes = [base_size * 2**i for i in range(num_sizes)]
+	timings = {1: [], 2: []}
+	for size in sizes:
+		filename = os.path.join(directory, f"day{day}-{size}.txt")
+		with open(filename, mode = 'w') as file:
+			file.write(generators.GENERATORS[day](size, random.Random(seed)))
+		for part in (1, 2):
+			timings[part].append(measure(day, part, filename, repeat))
+	return sizes, timings
+
+def format_timing(timing):
+	return "   error" if timing is None else "{:8.4f}".format(timing)
+
+def main():
+	parser = argparse.ArgumentParser(description = "Time every day's solvers on generated inputs of doubling size")
+	parser.add_argument("days", nargs = "*", type = int, help = "days to benchmark (default: all with a generator)")
+	parser.add_argument("-n", "--sizes", type = int, default = 4, help = "number of doublings of the base size")
+	parser.add_argument("-s", "--scale", type = float, default = 1.0, help = "multiplier for each day's base size")
+	parser.add_argument("-r", "--repeat", type = int, default = 1, help = "runs per measurement, the fastest is kept")
+	parser.add_argument("--seed", type = int, default = 2023)
+	arguments = parser.parse_args()
+
+	selected_days = arguments.days or sorted(generators.GENERATORS)
+	with tempfile.TemporaryDirectory() as directory:
+		## Parse from scratch on every run, so every measurement, repeats included, includes parsing
+		input_cache.enabled = False
+		for day in selected_days:
+			base_size = max(1, int(generators.SIZES[day] * arguments.scale))
+			sizes, timings = benchmark_day(day, base_size, arguments.sizes, arguments.repeat, arguments.seed, directory)
+			print("Day {:2}  size    {}".format(day, " ".join("{:>8}".format(size) for size in sizes)))
+			for part in (1, 2):
+				exponent = fit_exponent(sizes, timings[part])
+				print("        part {}  {}  ~ n^{}".format(part, " ".join(format_timing(timing) for timing in timings[part]), "?" if exponent is None else "{:.2f}".format(exponent)))
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,18 @@
+import collections
+
+## Solvers publish counters with `if counters.enabled: counters.increment(name)`, so a disabled hook costs one
+## attribute lookup and a branch
+enabled = False
+counts = collections.Counter()
+
+def enable():
+	global enabled
+	enabled = True
+	counts.clear()
+
+def disable():
+	global enabled
+	enabled = False
+
+def increment(name, amount = 1):
+	counts[name] += amount
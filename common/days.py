@@ -0,0 +1,67 @@
+import contextlib
+import cProfile
+import functools
+import importlib.util
+import io
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+
+from common import counters
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def discover():
+	days = []
+	for entry in os.listdir(ROOT):
+		if (day_match := re.fullmatch(r"day(\d+)", entry)) and os.path.isfile(os.path.join(ROOT, entry, "main.py")):
+			days.append(int(day_match[1]))
+	return sorted(days)
+
+def default_input(day):
+	return os.path.join(ROOT, f"day{day}", "input.txt")
+
+@functools.cache
+def load(day):
+	spec = importlib.util.spec_from_file_location(f"day{day}", os.path.join(ROOT, f"day{day}", "main.py"))
+	module = importlib.util.module_from_spec(spec)
+	## Registered so the day's own functions can be pickled, e.g. when it hands work to a process pool
+	sys.modules[spec.name] = module
+	spec.loader.exec_module(module)
+	return module
+
+def solve(day, part, filename):
+	## The solvers print their answers, so capture stdout rather than relying on a return value
+	solver = getattr(load(day), f"part{part}")
+	output = io.StringIO()
+	start = time.perf_counter()
+	with contextlib.redirect_stdout(output):
+		solver(filename)
+	return output.getvalue().strip(), time.perf_counter() - start
+
+def profile(day, part, filename, num_functions = 20):
+	## Runs a part under cProfile and tracemalloc with solver counters enabled, and summarises it as plain data
+	solver = getattr(load(day), f"part{part}")
+	output = io.StringIO()
+	profiler = cProfile.Profile()
+	counters.enable()
+	tracemalloc.start()
+	start = time.perf_counter()
+	try:
+		with contextlib.redirect_stdout(output):
+			profiler.runcall(solver, filename)
+		elapsed = time.perf_counter() - start
+		_, peak_memory = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+		counters.disable()
+	stats = pstats.Stats(profiler)
+	stats.sort_stats(pstats.SortKey.CUMULATIVE)
+	top_functions = []
+	for function in stats.fcn_list[:num_functions]:
+		primitive_calls, num_calls, total_time, cumulative_time, _ = stats.stats[function]
+		top_functions.append({"function": pstats.func_std_string(function), "calls": num_calls, "total_time": total_time, "cumulative_time": cumulative_time})
+	return {"day": day, "part": part, "output": output.getvalue().strip(), "time": elapsed, "peak_memory": peak_memory, "counters": dict(counters.counts), "top_functions": top_functions}
@@ -0,0 +1,82 @@
+import io
+
+## Directions are plain integers in clockwise order, so turning and reversing are arithmetic rather than enum lookups
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+
+def opposite(direction):
+	return direction ^ 2
+
+def right(direction):
+	return (direction + 1) & 3
+
+def left(direction):
+	return (direction - 1) & 3
+
+class Grid:
+	## The map is stored row by row in a flat bytearray with a one cell border around it, and positions are plain integer
+	## offsets into that buffer. Stepping off the map always lands on a border cell, so lookups need no bounds checks.
+	def __init__(self, rows, border = 0):
+		rows = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+		self.height = len(rows)
+		self.width = len(rows[0]) if rows else 0
+		self.stride = self.width + 2
+		self.border = border
+		padding = bytes([border])
+		self.cells = bytearray(padding * self.stride + b"".join(padding + row + padding for row in rows) + padding * self.stride)
+		self.deltas = (-self.stride, 1, self.stride, -1)
+
+	@classmethod
+	def from_file(cls, filename, border = 0):
+		with io.open(filename, mode = 'rb') as file:
+			return cls([line.strip() for line in file if not line.isspace()], border)
+
+	def blank(self, fill):
+		return Grid([bytes([fill]) * self.width] * self.height, self.border)
+
+	def position(self, y, x):
+		return (y + 1) * self.stride + x + 1
+
+	def coordinates(self, position):
+		y, x = divmod(position, self.stride)
+		return y - 1, x - 1
+
+	def step(self, position, direction):
+		return position + self.deltas[direction]
+
+	def manhattan_distance(self, position, other):
+		y, x = divmod(position, self.stride)
+		other_y, other_x = divmod(other, self.stride)
+		return abs(y - other_y) + abs(x - other_x)
+
+	def __getitem__(self, position):
+		return self.cells[position]
+
+	def __setitem__(self, position, item):
+		self.cells[position] = item
+
+	def __contains__(self, position):
+		y, x = self.coordinates(position)
+		return 0 <= y < self.height and 0 <= x < self.width
+
+	def find(self, glyph):
+		return self.cells.find(glyph)
+
+	def count(self, glyph):
+		return self.cells.count(glyph)
+
+	def positions(self):
+		for y in range(self.height):
+			start = self.position(y, 0)
+			yield from range(start, start + self.width)
+
+	def row(self, y):
+		start = self.position(y, 0)
+		return bytes(self.cells[start:start + self.width])
+
+	def column(self, x):
+		start = self.position(0, x)
+		return bytes(self.cells[start:start + self.height * self.stride:self.stride])
+
+	def __str__(self):
+		return "\n".join(self.row(y).decode() for y in range(self.height))
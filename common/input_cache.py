@@ -0,0 +1,105 @@
+import collections
+import functools
+import glob
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+
+from common.days import ROOT
+
+CACHE_DIRECTORY = os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".cache"))
+INPUT_DIRECTORY = os.path.join(CACHE_DIRECTORY, "inputs")
+MAX_SIZE = int(os.environ.get("AOC_INPUT_CACHE_SIZE", 256 * 2**20))
+## Parsed inputs kept in memory per parser, so long-lived processes solving many inputs stay bounded
+MEMO_SIZE = 4
+
+## When False every load parses from scratch, for measurements that must include parsing
+enabled = True
+
+def content_hash(*chunks):
+	digest = hashlib.sha256()
+	for chunk in chunks:
+		digest.update(chunk)
+	return digest.hexdigest()
+
+def source_hash(path):
+	## A module's source together with all of the shared code it may import, so editing a helper it calls changes the hash
+	sources = []
+	for source in [path] + sorted(glob.glob(os.path.join(ROOT, "common", "*.py"))):
+		with io.open(source, mode = 'rb') as file:
+			sources.append(content_hash(file.read()).encode())
+	return content_hash(*sources)
+
+def evict(directory, pattern, max_size):
+	## Removes the least recently used files matching pattern until the rest fit in max_size bytes
+	entries = []
+	for path in glob.glob(os.path.join(directory, pattern)):
+		try:
+			status = os.stat(path)
+		except OSError:
+			continue
+		entries.append((status.st_mtime, status.st_size, path))
+	total_size = sum(size for _, size, _ in entries)
+	for _, size, path in sorted(entries):
+		if total_size <= max_size:
+			break
+		try:
+			os.remove(path)
+		except OSError:
+			pass
+		total_size -= size
+
+def store(cache_path, result):
+	## Caching is best effort: an unwritable cache directory or an unpicklable result only costs the next run a parse
+	file = None
+	try:
+		os.makedirs(INPUT_DIRECTORY, exist_ok = True)
+		with tempfile.NamedTemporaryFile(dir = INPUT_DIRECTORY, delete = False) as file:
+			pickle.dump(result, file, protocol = pickle.HIGHEST_PROTOCOL)
+		os.replace(file.name, cache_path)
+		evict(INPUT_DIRECTORY, "*.pickle", MAX_SIZE)
+	except (OSError, pickle.PicklingError):
+		if file is not None:
+			try:
+				os.remove(file.name)
+			except OSError:
+				pass
+
+def parsed(parser = None, binary = False):
+	## Turns parser(text) into loader(filename). The parsed structure is shared between every caller in the process and
+	## pickled to disk keyed by the input contents and the source of the parser's module and of the shared code, so
+	## callers must treat it as read-only.
+	## With @parsed(binary = True) the parser receives the raw bytes instead of decoded text.
+	if parser is None:
+		return functools.partial(parsed, binary = binary)
+	path = os.path.abspath(parser.__code__.co_filename)
+	day = os.path.basename(os.path.dirname(path))
+	parser_hash = source_hash(path)
+	memo = collections.OrderedDict()
+
+	@functools.wraps(parser)
+	def load(filename):
+		with io.open(filename, mode = 'rb') as file:
+			data = file.read()
+		if not enabled:
+			return parser(data if binary else data.decode())
+		key = content_hash(parser_hash.encode(), data)
+		if key in memo:
+			memo.move_to_end(key)
+			return memo[key]
+		cache_path = os.path.join(INPUT_DIRECTORY, f"{day}.{parser.__qualname__}-{key}.pickle")
+		try:
+			with io.open(cache_path, mode = 'rb') as file:
+				result = pickle.load(file)
+			## Touch the pickle so eviction sees it as recently used
+			os.utime(cache_path)
+		except (OSError, EOFError, pickle.UnpicklingError):
+			result = parser(data if binary else data.decode())
+			store(cache_path, result)
+		memo[key] = result
+		if len(memo) > MEMO_SIZE:
+			memo.popitem(last = False)
+		return result
+	return load
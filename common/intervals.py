@@ -0,0 +1,127 @@
+import bisect
+import itertools
+import math
+
+from array import array
+
+## Values mapped per chunk by IntervalMap.map_many
+CHUNK_SIZE = 1 << 16
+
+def append_piece(starts, offsets, start, offset):
+	## Appends a piece starting at start, replacing a piece that would be empty and merging with an equal neighbour
+	if starts and starts[-1] == start:
+		starts.pop()
+		offsets.pop()
+	if not offsets or offsets[-1] != offset:
+		starts.append(start)
+		offsets.append(offset)
+
+class IntervalSet:
+	## A set of integers kept as sorted, disjoint, non-adjacent half-open ranges, flattened into one list of bounds
+	## [start0, stop0, start1, stop1, ...]. An integer is in the set when an odd number of bounds are at or below it.
+	def __init__(self, ranges = ()):
+		self.bounds = []
+		for values in ranges:
+			self.add(values.start, values.stop)
+
+	def add(self, start, stop):
+		## Bounds falling inside [start, stop] are dropped, which merges any ranges it overlaps or touches
+		if start >= stop:
+			return
+		i = bisect.bisect_left(self.bounds, start)
+		j = bisect.bisect_right(self.bounds, stop)
+		self.bounds[i:j] = ([start] if i % 2 == 0 else []) + ([stop] if j % 2 == 0 else [])
+
+	def __contains__(self, x):
+		return bisect.bisect_right(self.bounds, x) % 2 == 1
+
+	def __len__(self):
+		## The number of ranges, not of integers
+		return len(self.bounds) // 2
+
+	def __iter__(self):
+		return map(range, self.bounds[0::2], self.bounds[1::2])
+
+	def __bool__(self):
+		return bool(self.bounds)
+
+	def minimum(self):
+		return self.bounds[0]
+
+	def intersection(self, start, stop):
+		## The ranges inside [start, stop), found by two bisections
+		result = IntervalSet()
+		if start >= stop:
+			return result
+		i = bisect.bisect_right(self.bounds, start)
+		j = bisect.bisect_left(self.bounds, stop)
+		result.bounds = ([start] if i % 2 == 1 else []) + self.bounds[i:j] + ([stop] if j % 2 == 1 else [])
+		return result
+
+class IntervalMap:
+	## A piecewise translation of the integers, where x in [starts[i], starts[i + 1]) maps to x + offsets[i]. starts[0] is
+	## always -inf so every integer is covered, and neighbouring pieces never share an offset.
+	def __init__(self, starts = None, offsets = None):
+		self.starts = starts if starts is not None else [-math.inf]
+		self.offsets = offsets if offsets is not None else [0]
+
+	@classmethod
+	def from_ranges(cls, ranges):
+		## From (destination_start, source_start, length) triples, mapping every integer outside them to itself
+		starts, offsets = [-math.inf], [0]
+		for source_start, source_stop, offset in sorted((source_start, source_start + length, destination_start - source_start) for destination_start, source_start, length in ranges if length > 0):
+			if source_start < starts[-1]:
+				raise ValueError("overlapping source ranges")
+			append_piece(starts, offsets, source_start, offset)
+			append_piece(starts, offsets, source_stop, 0)
+		return cls(starts, offsets)
+
+	def __len__(self):
+		return len(self.starts)
+
+	def __call__(self, x):
+		return x + self.offsets[bisect.bisect_right(self.starts, x) - 1]
+
+	def map_many(self, values, chunk_size = CHUNK_SIZE):
+		## Maps an iterable of integers chunk by chunk, yielding an array('q') per chunk so that memory stays bounded by
+		## the chunk size however many values there are
+		starts, offsets, find = self.starts, self.offsets, bisect.bisect_right
+		values = iter(values)
+		while chunk := array('q', itertools.islice(values, chunk_size)):
+			yield array('q', [x + offsets[find(starts, x) - 1] for x in chunk])
+
+	def pieces(self):
+		## (start, stop, offset) for every piece, the last one stopping at inf
+		return zip(self.starts, self.starts[1:] + [math.inf], self.offsets)
+
+	def then(self, other):
+		## The map x -> other(self(x)). Each piece's image is split wherever other has a breakpoint inside it.
+		starts, offsets = [], []
+		for start, stop, offset in self.pieces():
+			i = bisect.bisect_right(other.starts, start + offset) - 1
+			while i < len(other.starts) and other.starts[i] < stop + offset:
+				append_piece(starts, offsets, max(start, other.starts[i] - offset), offset + other.offsets[i])
+				i += 1
+		return IntervalMap(starts, offsets)
+
+	def inverse(self):
+		## Only a map whose piece images tile the integers without gaps or overlaps has an inverse
+		starts, offsets = [], []
+		expected_start = -math.inf
+		for image_start, image_stop, offset in sorted((start + offset, stop + offset, -offset) for start, stop, offset in self.pieces()):
+			if image_start != expected_start:
+				raise ValueError("map is not a bijection")
+			append_piece(starts, offsets, image_start, offset)
+			expected_start = image_stop
+		return IntervalMap(starts, offsets)
+
+	def image(self, values):
+		## The image of an IntervalSet, as an IntervalSet. Each range is split only at the breakpoints inside it.
+		result = IntervalSet()
+		for value_range in values:
+			i = bisect.bisect_right(self.starts, value_range.start) - 1
+			while i < len(self.starts) and self.starts[i] < value_range.stop:
+				stop = self.starts[i + 1] if i + 1 < len(self.starts) else math.inf
+				result.add(max(self.starts[i], value_range.start) + self.offsets[i], min(stop, value_range.stop) + self.offsets[i])
+				i += 1
+		return result
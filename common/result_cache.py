@@ -0,0 +1,62 @@
+import glob
+import io
+import json
+import os
+import tempfile
+import time
+
+from common import days, input_cache
+from common.input_cache import CACHE_DIRECTORY, content_hash
+
+RESULT_DIRECTORY = os.path.join(CACHE_DIRECTORY, "results")
+MAX_SIZE = int(os.environ.get("AOC_RESULT_CACHE_SIZE", 64 * 2**20))
+
+def solver_hash(day):
+	## The day's own source and all of the shared code it may import, so fixing a common module invalidates its answers
+	return input_cache.source_hash(os.path.join(days.ROOT, f"day{day}", "main.py"))[:16]
+
+def entry_path(day, part, input_hash, solver):
+	## Entries are named day-part-solver-input, so a day's stale entries can be found by name alone
+	return os.path.join(RESULT_DIRECTORY, f"day{day}-part{part}-{solver}-{input_hash}.json")
+
+def lookup(day, part, input_hash, solver):
+	path = entry_path(day, part, input_hash, solver)
+	try:
+		with io.open(path, mode = 'r') as file:
+			entry = json.load(file)
+	except (OSError, ValueError):
+		return None
+	## Touch the entry so eviction sees it as recently used
+	os.utime(path)
+	return entry["output"]
+
+def store(day, part, input_hash, solver, output, max_size = MAX_SIZE):
+	os.makedirs(RESULT_DIRECTORY, exist_ok = True)
+	## Entries from an older version of this day's solver can never be hit again
+	for path in glob.glob(os.path.join(RESULT_DIRECTORY, f"day{day}-part*.json")):
+		_, _, entry_solver, _ = os.path.basename(path).split("-")
+		if entry_solver != solver:
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+	with tempfile.NamedTemporaryFile(mode = 'w', dir = RESULT_DIRECTORY, delete = False) as file:
+		json.dump({"day": day, "part": part, "output": output, "created": time.time()}, file)
+	os.replace(file.name, entry_path(day, part, input_hash, solver))
+	evict(max_size)
+
+def evict(max_size = MAX_SIZE):
+	input_cache.evict(RESULT_DIRECTORY, "*.json", max_size)
+
+def solve(day, part, filename):
+	## Like days.solve, but answers from the cache when this solver has seen the same input before.
+	## Returns (output, elapsed, hit).
+	start = time.perf_counter()
+	with io.open(filename, mode = 'rb') as file:
+		input_hash = content_hash(file.read())
+	solver = solver_hash(day)
+	if (output := lookup(day, part, input_hash, solver)) is not None:
+		return output, time.perf_counter() - start, True
+	output, elapsed = days.solve(day, part, filename)
+	store(day, part, input_hash, solver, output)
+	return output, elapsed, False
@@ -0,0 +1,62 @@
+import io
+import mmap
+import os
+import re
+
+from array import array
+
+## Numbers and line ends in one pass, so a buffer can be split into rows without slicing it into lines first
+TOKEN = re.compile(rb"-?\d+|\n")
+NEWLINE = b"\n"
+
+## Files at least this large are scanned through a memory map instead of being read into memory
+MMAP_THRESHOLD = 1 << 20
+
+class Rows:
+	## Every integer of a buffer in one flat array('q'), with offsets[i]:offsets[i + 1] delimiting the values of line i
+	def __init__(self, values, offsets):
+		self.values = values
+		self.offsets = offsets
+
+	def __len__(self):
+		return len(self.offsets) - 1
+
+	def __getitem__(self, i):
+		if i < 0:
+			i += len(self)
+		if not 0 <= i < len(self):
+			raise IndexError(i)
+		return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+	def __iter__(self):
+		values = self.values
+		for start, stop in zip(self.offsets, self.offsets[1:]):
+			yield values[start:stop]
+
+	def lengths(self):
+		return [stop - start for start, stop in zip(self.offsets, self.offsets[1:])]
+
+def integers(data):
+	## Tokenizes any bytes-like buffer (bytes, bytearray, mmap) into Rows, one row per line including lines without
+	## any numbers. A last line without a trailing newline only becomes a row if it holds numbers.
+	values = array('q')
+	offsets = array('q', [0])
+	append_value = values.append
+	append_offset = offsets.append
+	## finditer rather than findall, so only the output arrays grow with the input and not a list of every token
+	for match in TOKEN.finditer(data):
+		token = match[0]
+		if token == NEWLINE:
+			append_offset(len(values))
+		else:
+			append_value(int(token))
+	if len(values) > offsets[-1]:
+		append_offset(len(values))
+	return Rows(values, offsets)
+
+def load(filename):
+	with io.open(filename, mode = 'rb') as file:
+		if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+			return integers(file.read())
+		with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as data:
+			return integers(data)
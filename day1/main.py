@@ -1,13 +1,108 @@
+import collections
+import concurrent.futures
 import io
+import itertools
+import mmap
 import os
 import re
 import sys
 
+DIGITS = {str(value).encode(): value for value in range(1, 10)}
+WORDS = DIGITS | {word.encode(): value for value, word in enumerate(("one", "two", "three", "four", "five", "six", "seven", "eight", "nine"), start = 1)}
+
+def build_automaton(words):
+	## Aho-Corasick automaton with the failure links folded into a full transition table, so scanning costs one lookup
+	## per byte. Returns (transitions, output), where output[state] is the value of the word ending in that state or 0.
+	goto = [dict()]
+	output = [0]
+	for word, value in words.items():
+		state = 0
+		for byte in word:
+			if byte not in goto[state]:
+				goto[state][byte] = len(goto)
+				goto.append(dict())
+				output.append(0)
+			state = goto[state][byte]
+		output[state] = value
+
+	transitions = [bytearray(256) for _ in goto]
+	pending = collections.deque()
+	for byte, next_state in goto[0].items():
+		transitions[0][byte] = next_state
+		pending.append((next_state, 0))
+	while pending:
+		state, failure = pending.popleft()
+		output[state] = output[state] or output[failure]
+		transitions[state][:] = transitions[failure]
+		for byte, next_state in goto[state].items():
+			transitions[state][byte] = next_state
+			pending.append((next_state, transitions[failure][byte]))
+	return [bytes(row) for row in transitions], bytes(output)
+
+## The reversed automata recognise the reversed words, so the last digit of a line is found scanning back from its end
+DIGIT_AUTOMATA = build_automaton(DIGITS), build_automaton({word[::-1]: value for word, value in DIGITS.items()})
+WORD_AUTOMATA = build_automaton(WORDS), build_automaton({word[::-1]: value for word, value in WORDS.items()})
+
+## Files at least this large are memory-mapped and summed in newline-aligned chunks across a process pool
+PARALLEL_THRESHOLD = 64 * 2**20
+CHUNKS_PER_PROCESS = 4
+
+def calibration_sum(data, automata, start = 0, end = None):
+	(transitions, output), (reversed_transitions, reversed_output) = automata
+	total = 0
+	if end is None:
+		end = len(data)
+	while start < end:
+		stop = data.find(b"\n", start)
+		if stop < 0:
+			stop = end
+		state = 0
+		for i in range(start, stop):
+			state = transitions[state][data[i]]
+			if output[state]:
+				first = output[state]
+				break
+		else:
+			## No digit on this line
+			start = stop + 1
+			continue
+		state = 0
+		for i in range(stop - 1, start - 1, -1):
+			state = reversed_transitions[state][data[i]]
+			if reversed_output[state]:
+				total += 10 * first + reversed_output[state]
+				break
+		start = stop + 1
+	return total
+
+def chunk_sum(filename, automata, start, end):
+	with io.open(filename, mode = 'rb') as file, mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as data:
+		return calibration_sum(data, automata, start, end)
+
+def file_sum(filename, automata):
+	with io.open(filename, mode = 'rb') as file:
+		size = os.fstat(file.fileno()).st_size
+		if size < PARALLEL_THRESHOLD:
+			return calibration_sum(file.read(), automata)
+		with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as data:
+			## Move every evenly spaced split point forward to just past the next newline, so no line is cut in two
+			num_chunks = CHUNKS_PER_PROCESS * os.cpu_count()
+			boundaries = [0]
+			for i in range(1, num_chunks):
+				newline = data.find(b"\n", max(size * i // num_chunks, boundaries[-1]))
+				if newline < 0:
+					break
+				boundaries.append(newline + 1)
+			boundaries.append(size)
+	## Each worker maps the file itself, only the chunk bounds are sent over
+	with concurrent.futures.ProcessPoolExecutor() as executor:
+		return sum(executor.map(chunk_sum, itertools.repeat(filename), itertools.repeat(automata), boundaries, boundaries[1:]))
+
 def part1(filename):
-	print("Part 1: {}".format(sum((int(digits[0] + digits[-1]) for digits in (re.findall(r"(\d)", line) for line in io.open(filename, mode = 'r'))))))
+	print("Part 1: {}".format(file_sum(filename, DIGIT_AUTOMATA)))
 
 def part2(filename):
-	print("Part 2: {}".format(sum((int(digits[0] + digits[-1]) for digits in (re.findall(r"(\d)", re.sub(r"(o)(?=ne)|(t)(?=wo)|(t)(?=hree)|(f)(?=our)|(f)(?=ive)|(s)(?=ix)|(s)(?=even)|(e)(?=ight)|(n)(?=ine)", lambda m: "1" if m[1] else "2" if m[2] else "3" if m[3] else "4" if m[4] else "5" if m[5] else "6" if m[6] else "7" if m[7] else "8" if m[8] else "9", line)) for line in io.open(filename, mode = 'r'))))))
+	print("Part 2: {}".format(file_sum(filename, WORD_AUTOMATA)))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
@@ -7,6 +7,9 @@ import os
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import counters
+
 def all_equals(value, iterable):
 	return all(map(lambda item: item == value, iterable))
 
@@ -27,6 +30,8 @@ def find_num_matches(condition_record, group_lengths, start_index, constraints):
 		case [], _:
 			return 0
 	if (len(group_lengths), start_index) in constraints:
+		if counters.enabled:
+			counters.increment("memo_hits")
 		return constraints[len(group_lengths), start_index]
 	group_length, *rest = group_lengths
 	i = start_index
@@ -7,12 +7,13 @@ import os
 import re
 import sys
 
+## HASH_STEPS[current][character] is the next HASH value, so hashing is one table lookup per byte
+HASH_STEPS = [[(current + character) * 17 % 256 for character in range(256)] for current in range(256)]
+
 def hash(string):
 	hash = 0
-	for character in string:
-		hash += ord(character)
-		hash *= 17
-		hash %= 256
+	for character in string.encode():
+		hash = HASH_STEPS[hash][character]
 	return hash
 
 class HashMap:
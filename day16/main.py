@@ -7,56 +7,13 @@ import os
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.grid import Grid, UP, RIGHT, DOWN, LEFT, DIRECTIONS, opposite
+
 class EnumContainsValueMeta(enum.EnumMeta):
 	def __contains__(cls, value):
 		return value in cls.__members__.values()
 
-class Direction(tuple, enum.Enum):
-	def __init__(self, delta):
-		self.dy, self.dx = delta
-
-	def __neg__(self):
-		return Direction((-self.dy, -self.dx))
-	
-	def opposite(self):
-		return -self
-	
-	def right(self):
-		return Direction((-self.dy, self.dx))
-	
-	def left(self):
-		return Direction((self.dy, -self.dx))
-	
-	UP = (-1, 0)
-	DOWN = (1, 0)
-	LEFT = (0, -1)
-	RIGHT = (0, 1)
-
-UP = Direction.UP
-DOWN = Direction.DOWN
-LEFT = Direction.LEFT
-RIGHT = Direction.RIGHT
-
-class Position(tuple):
-	def __new__(cls, y, x):
-		self = tuple.__new__(cls, (y, x))
-		self.y = y
-		self.x = x
-		return self
-
-	def __add__(self, direction: Direction):
-		return Position(self.y + direction.dy, self.x + direction.dx)
-	
-	def get_item(self, item_map):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			return item_map[self.y][self.x]
-		else:
-			return None
-	
-	def set_item(self, item_map, item):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			item_map[self.y][self.x] = item
-
 class Tile(enum.StrEnum, metaclass = EnumContainsValueMeta):
 	def __new__(cls, glyph: str, paths: dict):
 		obj = str.__new__(cls, glyph)
@@ -64,8 +21,8 @@ class Tile(enum.StrEnum, metaclass = EnumContainsValueMeta):
 		obj.paths = paths
 		return obj
 
-	def get_exit_directions(self, enter_direction: Direction):
-		return self.paths[enter_direction.opposite()]
+	def get_exit_directions(self, enter_direction: int):
+		return self.paths[opposite(enter_direction)]
 
 	EMPTY = ".", {UP: [DOWN], DOWN: [UP], LEFT: [RIGHT], RIGHT: [LEFT]}
 	CISPOSITIONAL_MIRROR = "\\", {UP: [RIGHT], DOWN: [LEFT], LEFT: [DOWN], RIGHT: [UP]}
@@ -73,38 +30,41 @@ class Tile(enum.StrEnum, metaclass = EnumContainsValueMeta):
 	HORISONTAL_SPLITTER = "|", {UP: [DOWN], DOWN: [UP], LEFT: [UP, DOWN], RIGHT: [UP, DOWN]}
 	VERTICAL_SPLITTER = "-", {UP: [LEFT, RIGHT], DOWN: [LEFT, RIGHT], LEFT: [RIGHT], RIGHT: [LEFT]}
 
+## EXIT_DIRECTIONS[glyph][in_direction] lists the directions a beam leaves a tile in, empty for anything off the map
+EXIT_DIRECTIONS = [((), (), (), ())] * 256
+for tile in Tile:
+	EXIT_DIRECTIONS[ord(tile)] = tuple(tuple(tile.get_exit_directions(in_direction)) for in_direction in DIRECTIONS)
+
 def evaluate_beam(tile_map, start_position, in_direction):
-	energised = set()
-	open_set = {(start_position, in_direction)}
-	closed_set = set()
+	cells = tile_map.cells
+	deltas = tile_map.deltas
+	entered = bytearray(len(cells)) # bitmask of directions a beam has entered each tile in
+	open_set = [(start_position, in_direction)]
 	while open_set:
 		position, in_direction = open_set.pop()
-		closed_set.add((position, in_direction))
-		tile_glyph = position.get_item(tile_map)
-		if tile_glyph in Tile:
-			energised.add(position)
-			for out_direction in Tile(tile_glyph).get_exit_directions(in_direction):
-				next = position + out_direction, out_direction
-				if not next in closed_set:
-					open_set.add(next)
-	return energised
+		if entered[position] & (1 << in_direction):
+			continue
+		out_directions = EXIT_DIRECTIONS[cells[position]][in_direction]
+		if out_directions:
+			entered[position] |= 1 << in_direction
+			for out_direction in out_directions:
+				open_set.append((position + deltas[out_direction], out_direction))
+	return len(entered) - entered.count(0)
 
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		tile_map = [line.strip() for line in file if not line.isspace()]
-	energised = evaluate_beam(tile_map, Position(0, 0), RIGHT)
-	print("Part 1: {}".format(len(energised)))
+	tile_map = Grid.from_file(filename)
+	energised = evaluate_beam(tile_map, tile_map.position(0, 0), RIGHT)
+	print("Part 1: {}".format(energised))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		tile_map = [line.strip() for line in file if not line.isspace()]
-	height = len(tile_map)
-	width = len(tile_map[0])
+	tile_map = Grid.from_file(filename)
+	height = tile_map.height
+	width = tile_map.width
 	most_energised = 0
 	for y in range(height):
-		most_energised = max(most_energised, len(evaluate_beam(tile_map, Position(y, 0), RIGHT)), len(evaluate_beam(tile_map, Position(y, width - 1), LEFT)))
+		most_energised = max(most_energised, evaluate_beam(tile_map, tile_map.position(y, 0), RIGHT), evaluate_beam(tile_map, tile_map.position(y, width - 1), LEFT))
 	for x in range(width):
-		most_energised = max(most_energised, len(evaluate_beam(tile_map, Position(0, x), DOWN)), len(evaluate_beam(tile_map, Position(height - 1, x), UP)))
+		most_energised = max(most_energised, evaluate_beam(tile_map, tile_map.position(0, x), DOWN), evaluate_beam(tile_map, tile_map.position(height - 1, x), UP))
 	print("Part 2: {}".format(most_energised))
 
 if __name__ == "__main__":
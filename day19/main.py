@@ -7,6 +7,9 @@ import os
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import input_cache
+
 accepted_parts = []
 
 def accept(part):
@@ -52,75 +55,69 @@ class Workflow:
 		self.rules = rules
 
 	def process(self, part, workflows):
-		for rule in self.rules:
-			if comparison_match := re.match(r"(?P<attribute>\w+)(?P<operator>[<>])(?P<threshold>\d+):(?P<action>\w+)", rule):
-				attribute = comparison_match["attribute"]
-				operator = comparison_match["operator"]
-				threshold = int(comparison_match["threshold"])
+		for attribute, operator, threshold, action in self.rules:
+			if attribute:
 				value = part.__dict__[attribute]
 				matches = value < threshold if operator == "<" else value > threshold
-				if matches:
-					match comparison_match["action"]:
-						case "A":
-							return True
-						case "R":
-							return False
-						case workflow:
-							return workflows[workflow].process(part, workflows)
-			else:
-				match rule:
-					case "A":
-						return True
-					case "R":
-						return False
-					case workflow:
-						return workflows[workflow].process(part, workflows)
-					
+				if not matches:
+					continue
+			match action:
+				case "A":
+					return True
+				case "R":
+					return False
+				case workflow:
+					return workflows[workflow].process(part, workflows)
+
 	def preprocess(self, part_range, workflows):
 		accepted_ranges = []
-		for rule in self.rules:
+		for attribute, operator, threshold, action in self.rules:
 			if not part_range.count_parts():
 				break
-			if comparison_match := re.match(r"(?P<attribute>\w+)(?P<operator>[<>])(?P<threshold>\d+):(?P<action>\w+)", rule):
-				attribute = comparison_match["attribute"]
-				operator = comparison_match["operator"]
-				threshold = int(comparison_match["threshold"]) + (1 if operator == ">" else 0)
+			if attribute:
+				threshold += 1 if operator == ">" else 0
 				under, over = part_range.split(attribute, threshold)
 				selected, part_range = (under, over) if operator == "<" else (over, under)
-				if selected.count_parts():
-					match comparison_match["action"]:
-						case "A":
-							accepted_ranges.append(selected)
-						case "R":
-							pass
-						case workflow:
-							accepted_ranges += workflows[workflow].preprocess(selected, workflows)
 			else:
-				match rule:
+				selected = part_range
+			if selected.count_parts():
+				match action:
 					case "A":
-						accepted_ranges.append(part_range)
+						accepted_ranges.append(selected)
 					case "R":
 						pass
 					case workflow:
-						accepted_ranges += workflows[workflow].preprocess(part_range, workflows)
+						accepted_ranges += workflows[workflow].preprocess(selected, workflows)
 		return accepted_ranges
-		
+
 	def __repr__(self):
 		return self.name
 
+@input_cache.parsed
+def parse_system(input):
+	workflows_input, parts_input = input.strip().split("\n\n")
+	workflows = dict() # name: [(attribute, operator, threshold, action)]
+	for name, rules in re.findall(r"(\w+)\{([^}]+)\}", workflows_input):
+		workflows[name] = []
+		for rule in rules.split(","):
+			if comparison_match := re.match(r"(?P<attribute>\w+)(?P<operator>[<>])(?P<threshold>\d+):(?P<action>\w+)", rule):
+				workflows[name].append((comparison_match["attribute"], comparison_match["operator"], int(comparison_match["threshold"]), comparison_match["action"]))
+			else:
+				workflows[name].append((None, None, None, rule))
+	parts = [(int(x), int(m), int(a), int(s)) for x, m, a, s in re.findall(r"\{x=(\d+),m=(\d+),a=(\d+),s=(\d+)\}", parts_input)]
+	return workflows, parts
+
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		workflows_input, parts_input = file.read().strip().split("\n\n")
-	workflows = {name: Workflow(name, rules.split(",")) for name, rules in re.findall(r"(\w+)\{([^}]+)\}", workflows_input)}
+	workflow_rules, part_ratings = parse_system(filename)
+	workflows = {name: Workflow(name, rules) for name, rules in workflow_rules.items()}
 	workflow_in = workflows["in"]
-	parts = [Part(int(x), int(m), int(a), int(s)) for x, m, a, s in re.findall(r"\{x=(\d+),m=(\d+),a=(\d+),s=(\d+)\}", parts_input)]
+	parts = [Part(x, m, a, s) for x, m, a, s in part_ratings]
 	accepted_parts = [part for part in parts if workflow_in.process(part, workflows)]
 	print("Part 1: {}".format(sum(part.rating() for part in accepted_parts)))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		workflows_input, parts_input = file.read().strip().split("\n\n")
-	workflows = {name: Workflow(name, rules.split(",")) for name, rules in re.findall(r"(\w+)\{([^}]+)\}", workflows_input)}
+	workflow_rules, _ = parse_system(filename)
+	workflows = {name: Workflow(name, rules) for name, rules in workflow_rules.items()}
 	workflow_in = workflows["in"]
 	allpart = PartRange((1, 4000), (1, 4000), (1, 4000), (1, 4000))
 	accepted_part_ranges = [part_range for part_range in workflow_in.preprocess(allpart, workflows)]
@@ -1,3 +1,4 @@
+import bisect
 import functools
 import io
 import math
@@ -5,11 +6,116 @@ import os
 import re
 import sys
 
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import input_cache
+
+COLOURS = ("red", "green", "blue")
+BAG = (12, 13, 14)
+COLOUR_INDICES = {colour: i for i, colour in enumerate(COLOURS)}
+
+@input_cache.parsed
+def parse_games(input):
+	ids = array('q')
+	maxima = [array('q') for _ in COLOURS] # one column per colour, holding the most cubes of it seen in each game
+	for line in input.splitlines():
+		if game_match := re.match(r"Game (\d+):", line):
+			## Every draw of every set is a "number colour" item, and only the largest number per colour matters
+			most = [0] * len(COLOURS)
+			for item in line[game_match.end():].replace(";", ",").split(","):
+				if item := item.strip():
+					number, colour = item.split(" ")
+					i = COLOUR_INDICES[colour]
+					most[i] = max(most[i], int(number))
+			ids.append(int(game_match[1]))
+			for count, column in zip(most, maxima):
+				column.append(count)
+	return ids, maxima
+
+## The masks below are read in one go from strings of "0"s and "1"s with int(..., 2), most significant game first,
+## which keeps building them linear in the number of games
+ZERO, ONE = ord("0"), ord("1")
+BIT_DIGITS = [bytes(ONE if byte >> bit & 1 else ZERO for byte in range(256)) for bit in range(8)] # byte -> "0"/"1" of one bit
+
+def bit_planes(values):
+	## planes[k] has bit i set when bit k of values[i] is set, so the sum of the values selected by a mask is
+	## sum((mask & planes[k]).bit_count() << k). Every byte lane of the values is sliced straight out of the array's
+	## buffer, and each of its bits becomes a string of digits through a translate table.
+	values = array('q', reversed(values))
+	if sys.byteorder == "big":
+		values.byteswap()
+	data = values.tobytes()
+	return [int(data[k // 8::8].translate(BIT_DIGITS[k % 8]), 2) for k in range(max(values, default = 0).bit_length())]
+
+def threshold_masks(column):
+	## (levels, masks) with levels the distinct counts of the column in increasing order and masks[j] having bit i set
+	## when column[i] <= levels[j]. Each level flips its games' digits once, so the cost follows the distinct counts
+	## rather than the largest one.
+	positions = dict()
+	for i, count in enumerate(reversed(column)):
+		positions.setdefault(count, []).append(i)
+	levels = sorted(positions)
+	digits = bytearray(b"0") * len(column)
+	masks = []
+	for level in levels:
+		for i in positions[level]:
+			digits[i] = ONE
+		masks.append(int(digits, 2))
+	return levels, masks
+
+def masked_sum(mask, planes):
+	return sum((mask & plane).bit_count() << k for k, plane in enumerate(planes))
+
+class Games:
+	## Games stored column-wise. Every query works on integer bitmasks with one bit per game, so answering a bag costs a
+	## few big-int operations instead of a pass over the games.
+	def __init__(self, ids, maxima):
+		self.ids = ids
+		self.maxima = maxima
+		self.everything = (1 << len(ids)) - 1
+		## within[c] = (levels, masks) where masks[j] is the mask of games needing at most levels[j] cubes of colour c
+		self.within = [threshold_masks(column) for column in maxima]
+		self.powers = array('q', map(math.prod, zip(*maxima)))
+		self.id_planes = bit_planes(ids)
+		self.power_planes = bit_planes(self.powers)
+
+	@classmethod
+	def from_file(cls, filename):
+		return cls(*parse_games(filename))
+
+	def feasible(self, bag):
+		## Mask of the games possible with bag = (red, green, blue)
+		mask = self.everything
+		for (levels, masks), limit in zip(self.within, bag):
+			j = bisect.bisect_right(levels, limit) - 1
+			if j < 0:
+				return 0
+			mask &= masks[j]
+		return mask
+
+	def feasible_ids(self, bag):
+		mask = self.feasible(bag)
+		return [game_id for i, game_id in enumerate(self.ids) if mask >> i & 1]
+
+	def id_sum(self, bag):
+		return masked_sum(self.feasible(bag), self.id_planes)
+
+	def power_sum(self, bag = None):
+		## Sum of the powers of the minimal bags of every game, or only of the games possible with bag
+		return masked_sum(self.everything if bag is None else self.feasible(bag), self.power_planes)
+
+	def id_sums(self, bags):
+		return [self.id_sum(bag) for bag in bags]
+
+	def power_sums(self, bags):
+		return [self.power_sum(bag) for bag in bags]
+
 def part1(filename):
-	print("Part 1: {}".format(sum(map(lambda line: int(re.match(r"Game (\d+)", line)[1]), filter(lambda line: all((int(number) <= {"red": 12, "green": 13, "blue": 14}[colour] for number, colour in re.findall(r"(\d+) (red|green|blue)", line))), io.open(filename, mode = 'r'))))))
+	print("Part 1: {}".format(Games.from_file(filename).id_sum(BAG)))
 
 def part2(filename):
-	print("Part 2: {}".format(sum(map(lambda line: math.prod(functools.reduce(lambda colour_map, num_colour: {colour: max(colour_map[colour], {num_colour[1]: int(num_colour[0])}.get(colour, 0)) for colour in colour_map.keys()}, re.findall(r"(\d+) (red|green|blue)", line), {"red": 0, "green": 0, "blue": 0}).values()), io.open(filename, mode = 'r')))))
+	print("Part 2: {}".format(Games.from_file(filename).power_sum()))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
@@ -7,6 +7,9 @@ import os
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import counters, input_cache
+
 class Module:
 	def __init__(self, module_type, name, destinations):
 		self.module_type = module_type
@@ -29,12 +32,14 @@ class Module:
 			case "":
 				return pulse
 
+@input_cache.parsed
+def parse_configuration(input):
+	return [(module_type, name, destinations.split(", ")) for module_type, name, destinations in re.findall(r"(?P<type>[%&]?)(?P<name>\w+) -> (\w+(?:, \w+)*)", input.strip())]
+
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		input = file.read().strip()
 	modules = dict()
-	for module_type, name, destinations in re.findall(r"(?P<type>[%&]?)(?P<name>\w+) -> (\w+(?:, \w+)*)", input):
-		modules[name] = Module(module_type, name, destinations.split(", "))
+	for module_type, name, destinations in parse_configuration(filename):
+		modules[name] = Module(module_type, name, destinations)
 	for name in modules:
 		for destination in modules[name].destinations:
 			if destination in modules:
@@ -45,6 +50,8 @@ def part1(filename):
 		pulses.append(("button", "broadcaster", False))
 		while pulses:
 			source, name, pulse = pulses.popleft()
+			if counters.enabled:
+				counters.increment("pulses")
 			num_pulses[pulse] += 1
 			if name in modules:
 				module = modules[name]
@@ -55,11 +62,9 @@ def part1(filename):
 	print("Part 1: {}".format(num_pulses[True] * num_pulses[False]))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		input = file.read().strip()
 	modules = dict()
-	for module_type, name, destinations in re.findall(r"(?P<type>[%&]?)(?P<name>\w+) -> (\w+(?:, \w+)*)", input):
-		modules[name] = Module(module_type, name, destinations.split(", "))
+	for module_type, name, destinations in parse_configuration(filename):
+		modules[name] = Module(module_type, name, destinations)
 	modules["rx"] = Module("", "rx", [])
 	for name in modules:
 		for destination in modules[name].destinations:
@@ -128,6 +133,8 @@ def part2(filename):
 		pulses.append(("button", "broadcaster", False))
 		while pulses:
 			source, name, pulse = pulses.popleft()
+			if counters.enabled:
+				counters.increment("pulses")
 			if name in modules:
 				module = modules[name]
 				output = module.pulse(source, pulse)
@@ -7,89 +7,31 @@ import os
 import re
 import sys
 
-class EnumContainsValueMeta(enum.EnumMeta):
-	def __contains__(cls, value):
-		return value in cls.__members__.values()
-
-class Direction(tuple, enum.Enum):
-	def __init__(self, delta):
-		self.dy, self.dx = delta
-
-	def __neg__(self):
-		return Direction((-self.dy, -self.dx))
-	
-	def opposite(self):
-		return -self
-	
-	def right(self):
-		return Direction((-self.dy, self.dx))
-	
-	def left(self):
-		return Direction((self.dy, -self.dx))
-	
-	UP = (-1, 0)
-	DOWN = (1, 0)
-	LEFT = (0, -1)
-	RIGHT = (0, 1)
-
-UP = Direction.UP
-DOWN = Direction.DOWN
-LEFT = Direction.LEFT
-RIGHT = Direction.RIGHT
-
-class Position(tuple):
-	def __new__(cls, y, x):
-		self = tuple.__new__(cls, (y, x))
-		self.y = y
-		self.x = x
-		return self
-
-	def __add__(self, direction: Direction):
-		return Position(self.y + direction.dy, self.x + direction.dx)
-	
-	def get_manhattan_distance(self, other):
-		return abs(self.y - other.y) + abs(self.x - other.x)
-	
-	def get_item(self, item_map):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			return item_map[self.y][self.x]
-		else:
-			return None
-	
-	def set_item(self, item_map, item):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			item_map[self.y][self.x] = item
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.grid import Grid
 
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		field_map = [line.strip() for line in file if not line.isspace()]
-	closed_set = dict()
-	open_set = collections.deque()
-	for y, row in enumerate(field_map):
-		if "S" in row:
-			start_position = Position(y, row.index("S"))
-			open_set.append((start_position, 64))
-			closed_set[start_position] = 64
+	field_map = Grid.from_file(filename, border = ord("#"))
+	start_position = field_map.find(ord("S"))
+	closed_set = {start_position: 64}
+	open_set = collections.deque([(start_position, 64)])
 	while open_set:
 		position, remaining_steps = open_set.popleft()
 		if not remaining_steps:
 			continue
 		remaining_steps -= 1
-		for direction in Direction:
-			neighbour = position + direction
-			if neighbour not in closed_set and neighbour.get_item(field_map) == ".":
+		for delta in field_map.deltas:
+			neighbour = position + delta
+			if neighbour not in closed_set and field_map[neighbour] == ord("."):
 				open_set.append((neighbour, remaining_steps))
 				closed_set[neighbour] = remaining_steps
 	print("Part 1: {}".format(sum(1 - steps % 2 for steps in closed_set.values())))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		field_map = [line.strip() for line in file if not line.isspace()]
-	height = len(field_map)
-	width = len(field_map[0])
-	for y, row in enumerate(field_map):
-		if "S" in row:
-			start = Position(y, row.index("S"))
+	field_map = Grid.from_file(filename, border = ord("#"))
+	height = field_map.height
+	width = field_map.width
+	start_y, start_x = field_map.coordinates(field_map.find(ord("S")))
 
 	## This solver makes the following assumptions:
 	## - The field is a square with odd-valued dimensions
@@ -104,41 +46,42 @@ def part2(filename):
 	if height != width or height % 2 == 0:
 		print("Invalid assumption! Expected the field to be a square with odd-valued dimensions, found {}x{}".format(height, width))
 		return
-	if "#" in field_map[0] + field_map[-1] or "#" in "".join([row[0] + row[-1] for row in field_map]):
+	if b"#" in field_map.row(0) + field_map.row(height - 1) + field_map.column(0) + field_map.column(width - 1):
 		print("Invalid assumption! Expected outer edges of the field to be empty")
 		return
-	if "#" in field_map[start.y] or "#" in [row[start.x] for row in field_map]:
+	if b"#" in field_map.row(start_y) + field_map.column(start_x):
 		print("Invalid assumption! Expected row and column of the starting point to be empty")
 		return
 
 	## Now we can solve the problem
 	entry_points = dict()
-	for y, dy in ((0, height - start.y), (start.y, 0), (height - 1, start.y + 1)):
-		for x, dx in ((0, width - start.x), (start.x, 0), (width - 1, start.x + 1)):
-			entry_points[Position(y, x)] = dy + dx
+	for y, dy in ((0, height - start_y), (start_y, 0), (height - 1, start_y + 1)):
+		for x, dx in ((0, width - start_x), (start_x, 0), (width - 1, start_x + 1)):
+			entry_points[y, x] = dy + dx
 	steps_remaining = 26501365
 	congruence = steps_remaining % 2
 	num_reachable = 0
-	for point, distance_from_start in entry_points.items():
+	for (point_y, point_x), distance_from_start in entry_points.items():
+		point = field_map.position(point_y, point_x)
 		closed_set = {point: 0}
 		open_set = collections.deque([(point, 0)])
 		while open_set:
 			position, steps = open_set.popleft()
 			steps += 1
-			for direction in Direction:
-				neighbour = position + direction
-				if neighbour not in closed_set and (neighbour.get_item(field_map) == "." or neighbour.get_item(field_map) == "S"):
+			for delta in field_map.deltas:
+				neighbour = position + delta
+				if neighbour not in closed_set and field_map[neighbour] != ord("#"):
 					open_set.append((neighbour, steps))
 					closed_set[neighbour] = steps
 		distances_from_entry_point = {position: steps for position, steps in closed_set.items() if (steps + distance_from_start) % 2 == 0}, {position: steps for position, steps in closed_set.items() if (steps + distance_from_start) % 2 == 1}
-		if point == start:
+		if (point_y, point_x) == (start_y, start_x):
 			num_reachable += len(distances_from_entry_point[congruence])
 		else:
 			## Abusing that width == height and that all entry points are congruent with start in neigbouring fields
 			num_entered_fields = 1 + (steps_remaining - distance_from_start) // width
 			max_distance_in_field = max(max(distances_from_entry_point[0].values()), max(distances_from_entry_point[1].values()))
 			num_full_fields = 1 + (steps_remaining - distance_from_start - max_distance_in_field) // width
-			if point.y != start.y and point.x != start.x:
+			if point_y != start_y and point_x != start_x:
 				## Diagonals
 				num_full_congruent = ((num_full_fields + 1) // 2) ** 2
 				num_full_not_congruent = num_full_fields * (num_full_fields + 1) // 2 - num_full_congruent
@@ -8,6 +8,9 @@ import queue
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import input_cache, tokenize
+
 def sign(x):
 	return bool(x > 0) - bool(x < 0)
 
@@ -103,10 +106,12 @@ class Brick:
 	def __repr__(self):
 		return f"{self.low_end}~{self.high_end}"
 
+@input_cache.parsed(binary = True)
+def parse_snapshot(input):
+	return [tuple(coordinates) for coordinates in tokenize.integers(input) if coordinates]
 
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		bricks = [Brick(Position(int(z0), int(y0), int(x0)), Position(int(z1), int(y1), int(x1))) for x0, y0, z0, x1, y1, z1 in re.findall(r"(\d+),(\d+),(\d+)~(\d+),(\d+),(\d+)", file.read())]
+	bricks = [Brick(Position(z0, y0, x0), Position(z1, y1, x1)) for x0, y0, z0, x1, y1, z1 in parse_snapshot(filename)]
 	height_map = collections.defaultdict(set)
 	z_max = 0
 	for brick in bricks:
@@ -134,8 +139,7 @@ def part1(filename):
 	print("Part 1: {}".format(safe_bricks))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		bricks = [Brick(Position(int(z0), int(y0), int(x0)), Position(int(z1), int(y1), int(x1))) for x0, y0, z0, x1, y1, z1 in re.findall(r"(\d+),(\d+),(\d+)~(\d+),(\d+),(\d+)", file.read())]
+	bricks = [Brick(Position(z0, y0, x0), Position(z1, y1, x1)) for x0, y0, z0, x1, y1, z1 in parse_snapshot(filename)]
 	height_map = collections.defaultdict(set)
 	z_max = 0
 	for brick in bricks:
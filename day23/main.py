@@ -11,66 +11,11 @@ import sys
 from dataclasses import dataclass, field
 from typing import Any
 
-class EnumContainsValueMeta(enum.EnumMeta):
-	def __contains__(cls, value):
-		return value in cls.__members__.values()
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import counters
+from common.grid import Grid, UP, RIGHT, DOWN, LEFT, DIRECTIONS, opposite
 
-class Direction(tuple, enum.Enum):
-	def __init__(self, delta):
-		self.dy, self.dx = delta
-
-	def __neg__(self):
-		return Direction((-self.dy, -self.dx))
-
-	def opposite(self):
-		return -self
-
-	def right(self):
-		return Direction((-self.dy, self.dx))
-
-	def left(self):
-		return Direction((self.dy, -self.dx))
-
-	@classmethod
-	def from_glyph(cls, glyph):
-		match glyph:
-			case "^": return cls.UP
-			case "v": return cls.DOWN
-			case "<": return cls.LEFT
-			case ">": return cls.RIGHT
-
-	UP = (-1, 0)
-	DOWN = (1, 0)
-	LEFT = (0, -1)
-	RIGHT = (0, 1)
-
-UP = Direction.UP
-DOWN = Direction.DOWN
-LEFT = Direction.LEFT
-RIGHT = Direction.RIGHT
-
-class Position(tuple):
-	def __new__(cls, y, x):
-		self = tuple.__new__(cls, (y, x))
-		self.y = y
-		self.x = x
-		return self
-
-	def __add__(self, direction: Direction):
-		return Position(self.y + direction.dy, self.x + direction.dx)
-
-	def get_manhattan_distance(self, other):
-		return abs(self.y - other.y) + abs(self.x - other.x)
-
-	def get_item(self, item_map):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			return item_map[self.y][self.x]
-		else:
-			return None
-
-	def set_item(self, item_map, item):
-		if self.y in range(len(item_map)) and self.x in range(len(item_map[self.y])):
-			item_map[self.y][self.x] = item
+SLOPES = {ord("^"): UP, ord(">"): RIGHT, ord("v"): DOWN, ord("<"): LEFT}
 
 class Junction():
 	def __init__(self, position, distance):
@@ -87,10 +32,9 @@ class PrioritisedItem:
     item: Any=field(compare=False)
 
 def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		trail_map = [line.strip() for line in file if not line.isspace()]
-	start = Position(0, trail_map[0].index("."))
-	exit = Position(len(trail_map) - 1, trail_map[-1].index("."))
+	trail_map = Grid.from_file(filename, border = ord("#"))
+	start = trail_map.position(0, trail_map.row(0).index(b"."))
+	exit = trail_map.position(trail_map.height - 1, trail_map.row(trail_map.height - 1).index(b"."))
 	open_set = collections.deque([(start, DOWN, 0, Junction(start, 0))])
 	junctions = dict()
 	while open_set:
@@ -102,13 +46,12 @@ def part1(filename):
 			continue
 		num_paths = 0
 		out_directions = []
-		for direction in Direction:
-			if direction == last_direction.opposite():
+		for direction in DIRECTIONS:
+			if direction == opposite(last_direction):
 				continue
-			neighbour = position + direction
-			tile = neighbour.get_item(trail_map)
-			num_paths += tile != "#"
-			if tile == "." or Direction.from_glyph(tile) == direction:
+			tile = trail_map[trail_map.step(position, direction)]
+			num_paths += tile != ord("#")
+			if tile == ord(".") or SLOPES.get(tile) == direction:
 				out_directions.append(direction)
 		if num_paths > 1:
 			if position in junctions:
@@ -131,16 +74,15 @@ def part1(filename):
 				junctions[position] = junction
 				last_junction.downstream.add((junction, distance - last_junction.longest_distance))
 				for direction in out_directions:
-					open_set.append((position + direction, direction, distance + 1, junction))
+					open_set.append((trail_map.step(position, direction), direction, distance + 1, junction))
 		else:
-			open_set.append((position + out_directions[0], out_directions[0], distance + 1, last_junction))
+			open_set.append((trail_map.step(position, out_directions[0]), out_directions[0], distance + 1, last_junction))
 	print("Part 1: {}".format(exit_junction.longest_distance))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		trail_map = [line.strip() for line in file if not line.isspace()]
-	start = Position(0, trail_map[0].index("."))
-	exit = Position(len(trail_map) - 1, trail_map[-1].index("."))
+	trail_map = Grid.from_file(filename, border = ord("#"))
+	start = trail_map.position(0, trail_map.row(0).index(b"."))
+	exit = trail_map.position(trail_map.height - 1, trail_map.row(trail_map.height - 1).index(b"."))
 	start_junction = Junction(start, 0)
 	open_set = collections.deque([(start, DOWN, 0, start_junction)])
 	junctions = dict()
@@ -154,12 +96,11 @@ def part2(filename):
 			total_path_length += distance_to_last - 1
 			continue
 		out_directions = []
-		for direction in Direction:
-			if direction == last_direction.opposite():
+		for direction in DIRECTIONS:
+			if direction == opposite(last_direction):
 				continue
-			neighbour = position + direction
-			tile = neighbour.get_item(trail_map)
-			if tile != "#":
+			tile = trail_map[trail_map.step(position, direction)]
+			if tile != ord("#"):
 				out_directions.append(direction)
 		if len(out_directions) > 1:
 			if position in junctions:
@@ -176,9 +117,9 @@ def part2(filename):
 				last_junction.downstream.add((junction, distance_to_last))
 				total_path_length += distance_to_last - 1
 				for direction in out_directions:
-					open_set.append((position + direction, direction, 1, junction))
+					open_set.append((trail_map.step(position, direction), direction, 1, junction))
 		else:
-			open_set.append((position + out_directions[0], out_directions[0], distance_to_last + 1, last_junction))
+			open_set.append((trail_map.step(position, out_directions[0]), out_directions[0], distance_to_last + 1, last_junction))
 	total_path_length += len(junctions)
 	open_set = queue.PriorityQueue()
 	open_set.put(PrioritisedItem(-total_path_length, (start_junction, 0, set())))
@@ -186,6 +127,8 @@ def part2(filename):
 		prioritised_item = open_set.get()
 		heuristic = prioritised_item.priority
 		junction, distance, visited = prioritised_item.item
+		if counters.enabled:
+			counters.increment("states_expanded")
 		if junction == exit_junction:
 			longest_distance = distance
 			break
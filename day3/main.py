@@ -1,3 +1,5 @@
+import bisect
+import collections
 import io
 import itertools
 import math
@@ -5,11 +7,104 @@ import os
 import re
 import sys
 
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import input_cache
+
+NUMBER = re.compile(rb"\d+")
+SYMBOL = re.compile(rb"[^0-9.]")
+GEAR = ord("*")
+
+## Schematics at least this large skip the span index and use whole-row bitmask stencils instead
+STENCIL_THRESHOLD = 1 << 20
+## Maps a row to a string of "1"s and "0"s marking its symbols, which int(..., 2) turns into a bitmask
+SYMBOL_BITS = bytes.maketrans(bytes(range(256)), bytes(ord("0") if chr(byte) in "0123456789." else ord("1") for byte in range(256)))
+
+@input_cache.parsed(binary = True)
+def parse_schematic(input):
+	## One (starts, ends, values, symbols) entry per row. The number spans [start, end) are sorted by start, and the
+	## symbols are (x, glyph) pairs.
+	rows = []
+	for line in input.splitlines():
+		line = line.strip()
+		starts, ends, values = array('q'), array('q'), []
+		for number_match in NUMBER.finditer(line):
+			starts.append(number_match.start())
+			ends.append(number_match.end())
+			values.append(int(number_match[0]))
+		rows.append((starts, ends, values, [(symbol_match.start(), line[symbol_match.start()]) for symbol_match in SYMBOL.finditer(line)]))
+	return rows
+
+def adjacent_numbers(rows, y, x):
+	## (row, index) of every number touching column x in rows y - 1 to y + 1
+	for number_y in range(max(0, y - 1), min(len(rows), y + 2)):
+		starts, ends, _, _ = rows[number_y]
+		i = bisect.bisect_right(starts, x + 1)
+		while i > 0 and ends[i - 1] >= x:
+			i -= 1
+			yield number_y, i
+
+def dilated_symbols(lines):
+	## For every row, a string with "1" at each column that touches a symbol in this or a neighbouring row. The rows are
+	## bitmasks with bit x for column x, so the 3x3 stencil is three shifts and ORs per row.
+	width = max(map(len, lines), default = 0)
+	horizontal = []
+	for line in lines:
+		symbols = int(line.translate(SYMBOL_BITS)[::-1] or b"0", 2)
+		horizontal.append(symbols | symbols << 1 | symbols >> 1)
+	horizontal = [0] + horizontal + [0]
+	return [format(above | row | below, "0{}b".format(width + 1))[::-1] for above, row, below in zip(horizontal, horizontal[1:], horizontal[2:])]
+
+def stencil_part_numbers(input):
+	lines = [line.strip() for line in input.splitlines()]
+	total = 0
+	for line, touched in zip(lines, dilated_symbols(lines)):
+		for number_match in NUMBER.finditer(line):
+			if "1" in touched[number_match.start():number_match.end()]:
+				total += int(number_match[0])
+	return total
+
+def stencil_gear_ratios(input):
+	## Labels every digit run with the gears around it, then reduces each gear's list of adjacent numbers
+	lines = [line.strip() for line in input.splitlines()]
+	gears = collections.defaultdict(list)
+	for y, line in enumerate(lines):
+		for number_match in NUMBER.finditer(line):
+			start, end = max(0, number_match.start() - 1), number_match.end() + 1
+			for gear_y in range(max(0, y - 1), min(len(lines), y + 2)):
+				gear_x = lines[gear_y].find(b"*", start, end)
+				while gear_x >= 0:
+					gears[gear_y, gear_x].append(int(number_match[0]))
+					gear_x = lines[gear_y].find(b"*", gear_x + 1, end)
+	return sum(math.prod(numbers) for numbers in gears.values() if len(numbers) == 2)
+
+def read_large(filename):
+	## The input's bytes if it is large enough for the stencil engine, otherwise None
+	if os.path.getsize(filename) < STENCIL_THRESHOLD:
+		return None
+	with io.open(filename, mode = 'rb') as file:
+		return file.read()
+
 def part1(filename):
-	print("Part 1: {}".format(sum(sum(map(lambda match: int(match[0]), filter(lambda match: any(re.search(r"[^0-9.]", line[max(0, match.start() - 1):min(len(line), match.end() + 1)]) for line in (previous, current, next) if line), re.finditer(r"\d+", current)))) for previous, current, next in zip(*(itertools.islice(lines, n, None) for lines, n in zip(itertools.tee([None] + [line.strip() for line in io.open(filename, mode = 'r')] + [None], 3), itertools.count()))))))
+	if (input := read_large(filename)) is not None:
+		print("Part 1: {}".format(stencil_part_numbers(input)))
+		return
+	rows = parse_schematic(filename)
+	part_numbers = {number for y, (_, _, _, symbols) in enumerate(rows) for x, _ in symbols for number in adjacent_numbers(rows, y, x)}
+	print("Part 1: {}".format(sum(rows[y][2][i] for y, i in part_numbers)))
 
 def part2(filename):
-	print("Part 2: {}".format(sum(sum(math.prod(adjacent_numbers) for adjacent_numbers in ([int(number_match[0]) for line in (previous, current, next) if line for number_match in re.finditer(r"\d+", line) if match.start() in range(number_match.start() - 1, number_match.end() + 1)] for match in re.finditer(r"\*", current)) if len(adjacent_numbers) == 2) for previous, current, next in zip(*(itertools.islice(lines, n, None) for lines, n in zip(itertools.tee([None] + [line.strip() for line in io.open(filename, mode = 'r')] + [None], 3), itertools.count()))))))
+	if (input := read_large(filename)) is not None:
+		print("Part 2: {}".format(stencil_gear_ratios(input)))
+		return
+	rows = parse_schematic(filename)
+	gear_ratios = 0
+	for y, (_, _, _, symbols) in enumerate(rows):
+		for x, glyph in symbols:
+			if glyph == GEAR and len(numbers := list(adjacent_numbers(rows, y, x))) == 2:
+				gear_ratios += math.prod(rows[number_y][2][i] for number_y, i in numbers)
+	print("Part 2: {}".format(gear_ratios))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
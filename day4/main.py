@@ -1,3 +1,4 @@
+import collections
 import io
 import itertools
 import math
@@ -5,21 +6,38 @@ import os
 import re
 import sys
 
-from collections import Counter
+def number_mask(numbers):
+	mask = 0
+	for number in numbers.split():
+		mask |= 1 << int(number)
+	return mask
+
+def count_matches(line):
+	## Both halves of the card as bitmasks of their numbers, so the matches are the popcount of the intersection
+	winning_numbers, numbers = line.split(":")[1].split("|")
+	return (number_mask(winning_numbers) & number_mask(numbers)).bit_count()
 
 def part1(filename):
-	print("Part 1: {}".format(sum(1 << (num_winning - 1) for num_winning in (len(re.findall(r"\b(\d+)\b(?=.+\b\1\b)", line.split(":")[1].strip())) for line in io.open(filename, mode = 'r')) if num_winning > 0)))
+	print("Part 1: {}".format(sum(1 << (num_winning - 1) for num_winning in (count_matches(line) for line in io.open(filename, mode = 'r') if not line.isspace()) if num_winning > 0)))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		lines = [line for line in file]
-	num_scratchcards = Counter()
-	for line in lines:
-		current_scratchcard = int(re.match(r"Card\s+(\d+):", line)[1])
-		num_scratchcards[current_scratchcard] += 1
-		for won_scratchcard, _ in zip(itertools.count(current_scratchcard + 1), (re.findall(r"\b(\d+)\b(?=.+\b\1\b)", line.split(":")[1].strip()))):
-			num_scratchcards[won_scratchcard] += num_scratchcards[current_scratchcard]
-	print("Part 2: {}".format(num_scratchcards.total()))
+	## Streams the cards keeping a difference array of the copies won for the next cards, as a deque no longer than the
+	## largest match count. pending[0] is the change in won copies from the previous card to the next one.
+	pending = collections.deque()
+	won_copies = 0
+	num_scratchcards = 0
+	for line in io.open(filename, mode = 'r'):
+		if line.isspace():
+			continue
+		won_copies += pending.popleft() if pending else 0
+		copies = 1 + won_copies
+		num_scratchcards += copies
+		if num_matches := count_matches(line):
+			if len(pending) <= num_matches:
+				pending.extend(itertools.repeat(0, num_matches + 1 - len(pending)))
+			pending[0] += copies
+			pending[num_matches] -= copies
+	print("Part 2: {}".format(num_scratchcards))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
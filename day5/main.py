@@ -1,4 +1,5 @@
 import collections
+import functools
 import io
 import itertools
 import math
@@ -8,75 +9,38 @@ import sys
 
 from collections import Counter
 
-def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		input = file.read()
-
-	regex = re.compile(r"seeds: (?P<seeds>(\d+ ?)+)|(?P<header_from>\w+)-to-(?P<header_to>\w+) map:|(?P<to>\d+) (?P<from>\d+) (?P<length>\d+)|(?P<end_context>\n\n)")
-	almanac = collections.defaultdict(list)
-	from_context = None
-	to_context = "seed"
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import input_cache, tokenize
+from common.intervals import IntervalMap, IntervalSet
 
-	for input_match in regex.finditer(input):
-		if seeds := input_match["seeds"]:
-			almanac["seed"] = [int(seed) for seed in seeds.strip().split()]
-		elif input_match["header_from"]:
-			almanac[to_context] += almanac[from_context]
-			from_context = input_match["header_from"]
-			to_context = input_match["header_to"]
-			pass
-		elif (from_start := input_match["from"]) and (to_start := input_match["to"]) and (range_length := input_match["length"]):
-			from_range = range(int(from_start), int(from_start) + int(range_length))
-			to_offset = int(to_start) - int(from_start)
-			from_items = almanac[from_context]
-			i = 0
-			while i < len(from_items):
-				item = from_items[i]
-				if item in from_range:
-					almanac[to_context].append(item + to_offset)
-					from_items[i:i+1] = []
-				else:
-					i += 1
-	almanac[to_context] += almanac[from_context]
+@input_cache.parsed(binary = True)
+def parse_almanac(input):
+	rows = tokenize.integers(input)
+	seeds = list(rows[0])
+	maps = [] # [[(to_start, from_start, range_length)]]
 
-	print("Part 1: {}".format(min(almanac["location"])))
+	## Every map is a run of lines holding exactly three numbers, separated by blank and header lines
+	for row_length, mapping_rows in itertools.groupby(itertools.islice(rows, 1, None), key = len):
+		if row_length == 3:
+			maps.append([tuple(row) for row in mapping_rows])
+	return seeds, maps
 
-def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		input = file.read()
+def almanac_chain(maps):
+	## Every map section composed into the single seed to location map
+	return functools.reduce(IntervalMap.then, map(IntervalMap.from_ranges, maps), IntervalMap())
 
-	regex = re.compile(r"seeds: (?P<seeds>(\d+ ?)+)|(?P<header_from>\w+)-to-(?P<header_to>\w+) map:|(?P<to>\d+) (?P<from>\d+) (?P<length>\d+)|(?P<end_context>\n\n)")
-	almanac = collections.defaultdict(list)
-	from_context = None
-	to_context = "seed"
+def lowest_location(chain, seeds):
+	## Any number of individual seeds, looked up in bounded chunks
+	return min(min(locations) for locations in chain.map_many(seeds))
 
-	for input_match in regex.finditer(input):
-		if seeds := input_match["seeds"]:
-			almanac["seed"] = [range(int(seed_start), int(seed_start) + int(seed_length)) for seed_start, seed_length in re.findall(r"(\d+) (\d+)", seeds)]
-		elif input_match["header_from"]:
-			almanac[to_context] += almanac[from_context]
-			from_context = input_match["header_from"]
-			to_context = input_match["header_to"]
-			pass
-		elif (from_start := input_match["from"]) and (to_start := input_match["to"]) and (range_length := input_match["length"]):
-			from_range = range(int(from_start), int(from_start) + int(range_length))
-			to_offset = int(to_start) - int(from_start)
-			from_items = almanac[from_context]
-			i = 0
-			while i < len(from_items):
-				item = from_items[i]
-				if intersection := range(max(item.start, from_range.start), min(item.stop, from_range.stop)):
-					from_items[i:i+1] = []
-					if disjunction_before := range(item.start, intersection.start):
-						almanac[from_context].append(disjunction_before)
-					if disjunction_after := range(intersection.stop, item.stop):
-						almanac[from_context].append(disjunction_after)
-					almanac[to_context].append(range(intersection.start + to_offset, intersection.stop + to_offset))
-				else:
-					i += 1
-	almanac[to_context] += almanac[from_context]
+def part1(filename):
+	seeds, maps = parse_almanac(filename)
+	print("Part 1: {}".format(lowest_location(almanac_chain(maps), seeds)))
 
-	print("Part 2: {}".format(min(location.start for location in almanac["location"])))
+def part2(filename):
+	seeds, maps = parse_almanac(filename)
+	seed_ranges = IntervalSet(range(seed_start, seed_start + seed_length) for seed_start, seed_length in zip(seeds[0::2], seeds[1::2]))
+	print("Part 2: {}".format(almanac_chain(maps).image(seed_ranges).minimum()))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
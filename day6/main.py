@@ -8,11 +8,28 @@ import sys
 
 from collections import Counter
 
+def count_wins(time, distance):
+	## Holding h wins when h * (time - h) > distance, so the winners are lo to time - lo for the smallest winner lo. Exact
+	## for integers of any size: (time - isqrt(discriminant)) // 2 is the root rounded down or one above that.
+	discriminant = time * time - 4 * distance
+	if discriminant <= 0:
+		return 0
+	lo = (time - math.isqrt(discriminant)) // 2
+	if lo * (time - lo) <= distance:
+		lo += 1
+	return max(0, time - 2 * lo + 1)
+
+def count_wins_many(times, distances):
+	## Counts for many races in one call, as exact Python ints
+	return list(map(count_wins, times, distances))
+
 def part1(filename):
-	print("Part 1: {}".format(math.prod(list((2 * math.ceil(math.sqrt((int(time) / 2) ** 2 - int(distance)) - 1 + int(time) % 2 * 0.5) + 1 - int(time) % 2 for time, distance in zip(*[re.findall(r"(\d+)", line) for line in io.open(filename, mode = 'r')][0:2]))))))
+	times, distances = [list(map(int, re.findall(r"(\d+)", line))) for line in io.open(filename, mode = 'r')][0:2]
+	print("Part 1: {}".format(math.prod(count_wins_many(times, distances))))
 
 def part2(filename):
-	print("Part 2: {}".format(math.prod(list((2 * math.ceil(math.sqrt((int(time) / 2) ** 2 - int(distance)) - 1 + int(time) % 2 * 0.5) + 1 - int(time) % 2 for time, distance in zip(*[re.findall(r"(\d+)", line.replace(" ", "")) for line in io.open(filename, mode = 'r')][0:2]))))))
+	times, distances = [list(map(int, re.findall(r"(\d+)", line.replace(" ", "")))) for line in io.open(filename, mode = 'r')][0:2]
+	print("Part 2: {}".format(math.prod(count_wins_many(times, distances))))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
@@ -1,4 +1,5 @@
 import collections
+import functools
 import io
 import itertools
 import math
@@ -6,35 +7,64 @@ import os
 import re
 import sys
 
+from array import array
+
+CARDS = "23456789TJQKA"
+JOKER_CARDS = "J23456789TQKA"
+CARD_VALUES = {card: value for value, card in enumerate(CARDS)}
+JOKER_CARD_VALUES = {card: value for value, card in enumerate(JOKER_CARDS)}
+TYPE_VALUES = {(1, 1, 1, 1, 1): 0, (1, 1, 1, 2): 1, (1, 2, 2): 2, (1, 1, 3): 3, (2, 3): 4, (1, 4): 5, (5,): 6}
+JOKER = CARD_VALUES["J"]
+JOKER_RANKS = [JOKER_CARD_VALUES[card] for card in CARDS] # the value of each card when J is a joker
+CARD_DIGITS = str.maketrans(CARDS, "0123456789abc") # a hand read as a base 13 number is its index in the strength tables
+
+## From this many hands on, strengths come from a table of every possible hand, built once per process
+TABLE_THRESHOLD = 1 << 17
+
+@functools.cache
+def type_strength(sorted_cards, jokers):
+	counts = collections.Counter(sorted_cards)
+	num_jokers = counts.pop(JOKER, 0) if jokers else 0
+	hand_type = sorted(counts.values()) or [0]
+	hand_type[-1] += num_jokers
+	return TYPE_VALUES[tuple(hand_type)] << 20
+
+def hand_strength(cards, jokers = False):
+	## Packs a hand, given as card values in CARDS order, as its type above its five cards in 4 bit nibbles, so that
+	## comparing strengths compares hands
+	a, b, c, d, e = map(JOKER_RANKS.__getitem__, cards) if jokers else cards
+	return type_strength(tuple(sorted(cards)), jokers) | a << 16 | b << 12 | c << 8 | d << 4 | e
+
+@functools.cache
+def strength_table(jokers = False):
+	## hand_strength of all 13^5 hands, indexed by the hand's cards read as a base 13 number
+	return array('L', [hand_strength(cards, jokers) for cards in itertools.product(range(len(CARDS)), repeat = 5)])
+
+def hand_strengths(hands, jokers = False):
+	if len(hands) < TABLE_THRESHOLD:
+		return [hand_strength([CARD_VALUES[card] for card in hand], jokers) for hand in hands]
+	table = strength_table(jokers)
+	return [table[int(hand.translate(CARD_DIGITS), len(CARDS))] for hand in hands]
+
+def parse_hands(filename):
+	hands_bids = re.findall(r"(?P<hand>[2-9TJQKA]{5}) (?P<bid>\d+)", io.open(filename, mode = 'r').read())
+	return [hand for hand, _ in hands_bids], array('q', [int(bid) for _, bid in hands_bids])
+
+def total_winnings(strengths, bids):
+	## Ranks every hand, duplicates included. Each strength gets the hand's position packed below it, so sorting the
+	## plain ints is a stable sort by strength with no key function and no tuples.
+	index_bits = max(len(bids) - 1, 0).bit_length()
+	index_mask = (1 << index_bits) - 1
+	ranked = sorted([strength << index_bits | i for i, strength in enumerate(strengths)])
+	return sum(rank * bids[key & index_mask] for rank, key in enumerate(ranked, start = 1))
+
 def part1(filename):
-	print("Part 1: {}".format(sum(rank * bid for (_, bid), rank in zip(sorted({{(1, 1, 1, 1, 1): 0, (1, 1, 1, 2): 1, (1, 2, 2): 2, (1, 1, 3): 3, (2, 3): 4, (1, 4): 5, (5,): 6}[tuple(sorted(collections.Counter(hand).values()))] * len("23456789TJQKA") ** len(hand) + sum({card: value for value, card in enumerate("23456789TJQKA")}[card] * len("23456789TJQKA") ** (len(hand) - index - 1) for index, card in enumerate(hand)): int(bid) for hand, bid in re.findall(r"(?P<hand>[2-9TJQKA]{5}) (?P<bid>\d+)", io.open(filename, mode = 'r').read())}.items()), itertools.count(1)))))
+	hands, bids = parse_hands(filename)
+	print("Part 1: {}".format(total_winnings(array('L', hand_strengths(hands)), bids)))
 
 def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		lines = [line for line in file]
-
-	cards = "J23456789TQKA"
-	card_values = {card: value for card, value in zip(cards, itertools.count())}
-	type_values = {(1, 1, 1, 1, 1): 0, (1, 1, 1, 2): 1, (1, 2, 2): 2, (1, 1, 3): 3, (2, 3): 4, (1, 4): 5, (5,): 6}
-
-	hands = dict()
-	for line in lines:
-		hand_match = re.match(r"(?P<hand>[2-9TJQKA]{5}) (?P<bid>\d+)", line)
-		if hand_match:
-			hand = hand_match["hand"]
-			raw_type = collections.Counter(hand)
-			jokers = raw_type.pop("J", 0)
-			hand_type = sorted(raw_type.values())
-			if hand_type == []:
-				hand_type = [0]
-			hand_type[-1] += jokers
-			value = type_values[tuple(hand_type)]
-			for card in hand:
-				value *= len(cards)
-				value += card_values[card]
-			hands[value] = int(hand_match["bid"])
-
-	print("Part 2: {}".format(sum(rank * bid for (_, bid), rank in zip(sorted(hands.items()), itertools.count(1)))))
+	hands, bids = parse_hands(filename)
+	print("Part 2: {}".format(total_winnings(array('L', hand_strengths(hands, jokers = True)), bids)))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
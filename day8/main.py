@@ -1,3 +1,4 @@
+import bisect
 import collections
 import io
 import itertools
@@ -6,43 +7,109 @@ import os
 import re
 import sys
 
-def part1(filename):
-	with io.open(filename, mode = 'r') as file:
-		lines = [line.strip() for line in file]
+from array import array
 
-	directions = itertools.cycle(lines[0])
-	nodes = {node: (left, right) for matching in (re.findall(r"(\w+) = \((\w+), (\w+)\)", line.strip()) for line in lines) for node, left, right in matching if matching}
-	current_node = "AAA"
-	target_node = "ZZZ"
-	num_steps = 0
-	while current_node != target_node:
-		left, right = nodes[current_node]
-		current_node = left if next(directions) == "L" else right
-		num_steps += 1
-	print("Part 1: {}".format(num_steps))
+class Network:
+	## The network compiled to integer node ids and walked a whole pass over the instructions at a time. Pass results
+	## and the binary lifting levels over them are only built for the nodes that walks actually reach, the first time
+	## they are reached.
+	def __init__(self, instructions, nodes, is_target):
+		self.names = list(nodes)
+		self.ids = {name: i for i, name in enumerate(self.names)}
+		self.period = len(instructions)
+		moves = {"L": array('l', [self.ids[left] for left, _ in nodes.values()]), "R": array('l', [self.ids[right] for _, right in nodes.values()])}
+		self.moves = [moves[direction] for direction in instructions]
+		self.targets = bytearray(bool(is_target(name)) for name in self.names)
+		self.passes = dict() # node -> (node after one pass, steps of that pass landing on a target)
+		## jumps[j] maps node -> (node after 2^(j + 1) passes, whether a target is reached on the way). No walk can go
+		## more passes than there are nodes without repeating itself, so levels up to the node count's bit length do.
+		self.jumps = [dict() for _ in range(len(self.names).bit_length())]
 
-def part2(filename):
-	with io.open(filename, mode = 'r') as file:
-		lines = [line.strip() for line in file]
+	@classmethod
+	def from_file(cls, filename, is_target):
+		with io.open(filename, mode = 'r') as file:
+			lines = [line.strip() for line in file]
+		nodes = {node: (left, right) for matching in (re.findall(r"(\w+) = \((\w+), (\w+)\)", line) for line in lines) for node, left, right in matching}
+		return cls(lines[0], nodes, is_target)
+
+	def node_id(self, name):
+		return self.ids[name]
+
+	def walk_pass(self, node):
+		if (result := self.passes.get(node)) is None:
+			targets = self.targets
+			hits = []
+			position = node
+			for step, move in enumerate(self.moves, start = 1):
+				position = move[position]
+				if targets[position]:
+					hits.append(step)
+			result = self.passes[node] = position, hits
+		return result
+
+	def jump(self, level, node):
+		## (node after 2^level passes, whether a target is reached on the way)
+		if level == 0:
+			after, hits = self.walk_pass(node)
+			return after, bool(hits)
+		memo = self.jumps[level - 1]
+		if (result := memo.get(node)) is None:
+			middle, hit = self.jump(level - 1, node)
+			after, later_hit = self.jump(level - 1, middle)
+			result = memo[node] = after, hit or later_hit
+		return result
 
-	directions = itertools.cycle(lines[0])
-	nodes = {node: (left, right) for matching in (re.findall(r"(\w+) = \((\w+), (\w+)\)", line.strip()) for line in lines) for node, left, right in matching if matching}
-	current_nodes = [node for node in nodes if node[-1] == "A"]
-	num_steps = 0
-	target_nodes = [0 for _ in current_nodes]
-	loop_length = [0 for _ in current_nodes]
-	while not all(loop_length):
-		direction = next(directions)
-		num_steps += 1
-		for i in range(len(current_nodes)):
-			left, right = nodes[current_nodes[i]]
-			node = left if direction == "L" else right
-			current_nodes[i] = node
-			if node[-1] == "Z":
-				if not target_nodes[i]:
-					target_nodes[i] = num_steps
-				elif not loop_length[i]:
-					loop_length[i] = num_steps - target_nodes[i]
+	def skip_passes(self, node, num_passes):
+		level = 0
+		while num_passes:
+			if num_passes & 1:
+				node, _ = self.jump(level, node)
+			num_passes >>= 1
+			level += 1
+		return node
+
+	def next_hit(self, node, step = 0):
+		## The first step after step at which a walk starting from node reaches a target, or None if it never does
+		num_passes, phase = divmod(step, self.period)
+		node = self.skip_passes(node, num_passes)
+		after, hits = self.walk_pass(node)
+		if (i := bisect.bisect_right(hits, phase)) < len(hits):
+			return num_passes * self.period + hits[i]
+		node = after
+		num_passes += 1
+		## Skip blocks of 1, 2, 4, ... passes while they miss every target, so the work grows with the distance to the
+		## hit, then narrow down to the first pass with a hit from the largest block that had one
+		level = 0
+		while level <= len(self.jumps):
+			after, hit = self.jump(level, node)
+			if hit:
+				break
+			node = after
+			num_passes += 1 << level
+			level += 1
+		else:
+			return None
+		for level in reversed(range(level)):
+			after, hit = self.jump(level, node)
+			if not hit:
+				node = after
+				num_passes += 1 << level
+		_, hits = self.walk_pass(node)
+		return num_passes * self.period + hits[0]
+
+def part1(filename):
+	network = Network.from_file(filename, lambda node: node == "ZZZ")
+	print("Part 1: {}".format(network.next_hit(network.node_id("AAA"))))
+
+def part2(filename):
+	network = Network.from_file(filename, lambda node: node[-1] == "Z")
+	target_nodes = []
+	loop_length = []
+	for node, name in enumerate(network.names):
+		if name[-1] == "A":
+			first_hit = network.next_hit(node)
+			target_nodes.append(first_hit)
+			loop_length.append(network.next_hit(node, first_hit) - first_hit)
 	while (num_unique := len(collections.Counter(target_nodes))) != 1:
 		if num_unique != len(target_nodes):
 			visited = dict()
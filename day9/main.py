@@ -3,25 +3,36 @@ import functools
 import io
 import itertools
 import math
+import operator
 import os
 import re
 import sys
 
-def extrapolate(series):
-	match series:
-		case [n]:
-			return n, n
-		case _ if all(n == 0 for n in series):
-			return 0, 0
-		case _:
-			b, a = extrapolate([n - m for m, n in zip(series, series[1:])])
-			return series[0] - b, series[-1] + a
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import tokenize
+
+@functools.cache
+def coefficients(length):
+	## Weights giving the next and the previous value of any series of this length as a weighted sum of its values,
+	## assuming its length-th differences are all zero: the next value is sum((-1)^(n-1-k) C(n, k) a_k) and the
+	## previous one sum((-1)^k C(n, k+1) a_k)
+	following = [(-1) ** (length - 1 - k) * math.comb(length, k) for k in range(length)]
+	preceding = [(-1) ** k * math.comb(length, k + 1) for k in range(length)]
+	return following, preceding
+
+def column_sums(filename):
+	## Extrapolation is linear, so the sum over all series only needs the column sums of each group of equal length
+	groups = collections.defaultdict(list)
+	for series in tokenize.load(filename):
+		if series:
+			groups[len(series)].append(series)
+	return {length: list(map(sum, zip(*group))) for length, group in groups.items()}
 
 def part1(filename):
-	print("Part 1: {}".format(sum(extrapolate(series)[1] for series in [list(map(int, line.strip().split())) for line in io.open(filename, mode = 'r') if not line.isspace()])))
+	print("Part 1: {}".format(sum(sum(map(operator.mul, coefficients(length)[0], columns)) for length, columns in column_sums(filename).items())))
 
 def part2(filename):
-	print("Part 1: {}".format(sum(extrapolate(series)[0] for series in [list(map(int, line.strip().split())) for line in io.open(filename, mode = 'r') if not line.isspace()])))
+	print("Part 1: {}".format(sum(sum(map(operator.mul, coefficients(length)[1], columns)) for length, columns in column_sums(filename).items())))
 
 if __name__ == "__main__":
 	if len(sys.argv) > 1:
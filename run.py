@@ -0,0 +1,75 @@
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+from common import days, result_cache
+
+def run_part(day, part, filename, cache):
+	try:
+		if cache:
+			output, elapsed, hit = result_cache.solve(day, part, filename)
+			if hit:
+				output += " (cached)"
+		else:
+			output, elapsed = days.solve(day, part, filename)
+	except Exception as error:
+		output, elapsed = "Error: {!r}".format(error), 0.0
+	return day, part, output, elapsed
+
+def profile_part(day, part, filename, num_functions):
+	try:
+		report = days.profile(day, part, filename, num_functions)
+	except Exception as error:
+		report = {"day": day, "part": part, "output": "Error: {!r}".format(error), "time": 0.0}
+	return day, part, report["output"], report["time"], report
+
+def main():
+	parser = argparse.ArgumentParser(description = "Run every day's solvers in parallel")
+	parser.add_argument("days", nargs = "*", type = int, help = "days to run (default: all)")
+	parser.add_argument("-i", "--input", default = "input.txt", help = "input file name inside each day directory")
+	parser.add_argument("-j", "--processes", type = int, default = os.cpu_count(), help = "size of the process pool")
+	parser.add_argument("-c", "--cache", action = "store_true", help = "answer from and fill the on-disk result cache")
+	parser.add_argument("-p", "--profile", metavar = "FILE", help = "profile every part and write a JSON report to FILE ('-' for stdout)")
+	parser.add_argument("--top", type = int, default = 20, help = "number of functions to list per profiled part")
+	arguments = parser.parse_args()
+
+	selected_days = arguments.days or days.discover()
+	results = collections.defaultdict(dict)
+	reports = []
+	start = time.perf_counter()
+	with concurrent.futures.ProcessPoolExecutor(max_workers = arguments.processes) as executor:
+		if arguments.profile:
+			futures = [executor.submit(profile_part, day, part, os.path.join(days.ROOT, f"day{day}", arguments.input), arguments.top) for day in selected_days for part in (1, 2)]
+		else:
+			futures = [executor.submit(run_part, day, part, os.path.join(days.ROOT, f"day{day}", arguments.input), arguments.cache) for day in selected_days for part in (1, 2)]
+		for future in concurrent.futures.as_completed(futures):
+			day, part, output, elapsed, *report = future.result()
+			results[day][part] = output, elapsed
+			reports += report
+	wall_time = time.perf_counter() - start
+
+	if arguments.profile:
+		reports.sort(key = lambda report: (report["day"], report["part"]))
+		if arguments.profile == "-":
+			json.dump(reports, sys.stdout, indent = "\t")
+			return
+		with open(arguments.profile, mode = 'w') as file:
+			json.dump(reports, file, indent = "\t")
+
+	total_solver_time = 0.0
+	for day in selected_days:
+		day_time = sum(elapsed for _, elapsed in results[day].values())
+		total_solver_time += day_time
+		print("Day {:2}: {:8.3f}s".format(day, day_time))
+		for part in (1, 2):
+			output, elapsed = results[day][part]
+			for line in output.splitlines() or [""]:
+				print("    {:8.3f}s  {}".format(elapsed, line))
+	print("{} parts in {:.3f}s wall time ({:.3f}s solver time, {:.2f} parts/s, {:.2f}x parallel speedup)".format(2 * len(selected_days), wall_time, total_solver_time, 2 * len(selected_days) / wall_time, total_solver_time / wall_time))
+
+if __name__ == "__main__":
+	main()
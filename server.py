@@ -0,0 +1,141 @@
+import argparse
+import concurrent.futures
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+
+from common import days, result_cache
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "aoc-solver.sock")
+
+## Every message is a JSON object preceded by its length as a 4 byte big-endian unsigned integer.
+## Requests are {"day": N, "part": P, "input": text}, responses are {"output": text, "time": seconds} or {"error": text}.
+HEADER = struct.Struct(">I")
+
+def send_message(connection, message):
+	body = json.dumps(message).encode()
+	connection.sendall(HEADER.pack(len(body)) + body)
+
+def receive_exactly(connection, length):
+	data = bytearray()
+	while len(data) < length:
+		chunk = connection.recv(length - len(data))
+		if not chunk:
+			raise EOFError
+		data += chunk
+	return bytes(data)
+
+def receive_message(connection):
+	length, = HEADER.unpack(receive_exactly(connection, HEADER.size))
+	return json.loads(receive_exactly(connection, length))
+
+input_directory = None
+use_result_cache = False
+
+def preload(directory, cache):
+	global input_directory, use_result_cache
+	input_directory = directory
+	use_result_cache = cache
+	for day in days.discover():
+		days.load(day)
+
+def solve_input(day, part, input):
+	## Each request's input only lives on disk while it is being solved. Repeated inputs still hit the workers' parse
+	## caches, which are keyed by content rather than by file name.
+	with tempfile.NamedTemporaryFile(dir = input_directory, suffix = ".txt") as file:
+		file.write(input.encode())
+		file.flush()
+		if use_result_cache:
+			output, elapsed, _ = result_cache.solve(day, part, file.name)
+			return output, elapsed
+		return days.solve(day, part, file.name)
+
+class RequestHandler(socketserver.BaseRequestHandler):
+	def handle(self):
+		while True:
+			try:
+				request = receive_message(self.request)
+			except (EOFError, ConnectionError):
+				return
+			try:
+				output, elapsed = self.server.executor.submit(solve_input, int(request["day"]), int(request["part"]), request["input"]).result()
+				response = {"output": output, "time": elapsed}
+			except Exception as error:
+				response = {"error": repr(error)}
+			send_message(self.request, response)
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+	daemon_threads = True
+
+def remove_stale_socket(socket_path):
+	## Only a socket that no server answers on any more may be replaced
+	try:
+		mode = os.stat(socket_path).st_mode
+	except FileNotFoundError:
+		return
+	if not stat.S_ISSOCK(mode):
+		raise FileExistsError("{} exists and is not a socket".format(socket_path))
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+		try:
+			connection.connect(socket_path)
+		except ConnectionRefusedError:
+			os.unlink(socket_path)
+			return
+	raise FileExistsError("another server is listening on {}".format(socket_path))
+
+def serve(socket_path, processes, cache):
+	remove_stale_socket(socket_path)
+	with tempfile.TemporaryDirectory() as directory, concurrent.futures.ProcessPoolExecutor(max_workers = processes, initializer = preload, initargs = (directory, cache)) as executor, SolverServer(socket_path, RequestHandler) as server:
+		server.executor = executor
+		print("Listening on {}".format(socket_path), file = sys.stderr)
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			os.unlink(socket_path)
+
+def query(socket_path, day, part, input):
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+		connection.connect(socket_path)
+		send_message(connection, {"day": day, "part": part, "input": input})
+		return receive_message(connection)
+
+def main():
+	parser = argparse.ArgumentParser(description = "Serve solver requests over a Unix domain socket")
+	parser.add_argument("-s", "--socket", default = DEFAULT_SOCKET, help = "path of the socket")
+	subparsers = parser.add_subparsers(dest = "command", required = True)
+	serve_parser = subparsers.add_parser("serve", help = "start the server")
+	serve_parser.add_argument("-j", "--processes", type = int, default = os.cpu_count(), help = "size of the worker pool")
+	serve_parser.add_argument("-c", "--cache", action = "store_true", help = "answer from and fill the on-disk result cache")
+	query_parser = subparsers.add_parser("query", help = "ask a running server to solve an input")
+	query_parser.add_argument("day", type = int)
+	query_parser.add_argument("part", type = int, choices = (1, 2))
+	query_parser.add_argument("input", nargs = "?", help = "input file (default: the day's input.txt, '-' for stdin)")
+	arguments = parser.parse_args()
+
+	if arguments.command == "serve":
+		try:
+			serve(arguments.socket, arguments.processes, arguments.cache)
+		except FileExistsError as error:
+			print("Error: {}".format(error), file = sys.stderr)
+			sys.exit(1)
+	else:
+		if arguments.input == "-":
+			input = sys.stdin.read()
+		else:
+			with open(arguments.input or days.default_input(arguments.day), mode = 'r') as file:
+				input = file.read()
+		response = query(arguments.socket, arguments.day, arguments.part, input)
+		if "error" in response:
+			print("Error: {}".format(response["error"]), file = sys.stderr)
+			sys.exit(1)
+		print(response["output"])
+
+if __name__ == "__main__":
+	main()